@@ -8,6 +8,16 @@ import numpy as np
 from PIL import Image
 import io
 import base64
+import atexit
+
+@st.cache_resource
+def get_capture_recorder():
+    """Get the long-lived database that batches automated capture rows"""
+    from poker.database import Database
+    db = Database()
+    # Write out any rows still buffered when the app exits
+    atexit.register(db.close)
+    return db
 
 def create_screen_capture_controls():
     """Create UI controls for browser-based screen capture functionality"""
@@ -65,6 +75,7 @@ def create_screen_capture_controls():
     if stop_button:
         st.session_state.monitoring_active = False
         st.session_state.screen_capture.stop_continuous_capture()
+        get_capture_recorder().flush()
         st.info("Monitoring stopped.")
 
     # Only show calibration when not monitoring
@@ -165,8 +176,8 @@ def create_screen_capture_controls():
                 changes = st.session_state.table_analyzer.detect_significant_changes()
                 if any(changes.values()):
                     st.markdown("### 💡 Recommendation")
-                    from poker.recommendations import RecommendationEngine
-                    engine = RecommendationEngine()
+                    from poker.recommendations import get_recommendation_engine
+                    engine = get_recommendation_engine()
                     recommendation = engine.get_recommendation(
                         hole_cards=results.get('hole_cards', []),
                         community_cards=results.get('community_cards', []),
@@ -197,27 +208,22 @@ def process_captured_frame(base64_image: str):
             # Record in database if significant changes detected
             changes = st.session_state.table_analyzer.detect_significant_changes()
             if any(changes.values()):
-                from poker.database import Database
-                db = Database()
-                try:
-                    db.record_automated_capture(
-                        position=analysis['position'],
-                        active_position=analysis['position'],
-                        pot_size=analysis['pot_size'],
-                        current_bet=max(analysis['actions'].values()),
-                        player_stacks={'hero': analysis['stack_size']},
-                        detected_cards={
-                            'hole_cards': analysis['hole_cards'],
-                            'community_cards': analysis['community_cards']
-                        },
-                        action_history=[{
-                            'action': action,
-                            'amount': amount
-                        } for action, amount in analysis['actions'].items() if amount > 0],
-                        confidence_score=analysis['position_confidence']
-                    )
-                finally:
-                    db.close()
-                    
+                get_capture_recorder().record_automated_capture(
+                    position=analysis['position'],
+                    active_position=analysis['position'],
+                    pot_size=analysis['pot_size'],
+                    current_bet=max(analysis['actions'].values()),
+                    player_stacks={'hero': analysis['stack_size']},
+                    detected_cards={
+                        'hole_cards': analysis['hole_cards'],
+                        'community_cards': analysis['community_cards']
+                    },
+                    action_history=[{
+                        'action': action,
+                        'amount': amount
+                    } for action, amount in analysis['actions'].items() if amount > 0],
+                    confidence_score=analysis['position_confidence']
+                )
+                
     except Exception as e:
         st.error(f"Error processing frame: {str(e)}")
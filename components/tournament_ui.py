@@ -9,60 +9,64 @@ def create_tournament_controls() -> Optional[Dict]:
         if not is_tournament:
             return None
             
-        col1, col2 = st.columns(2)
+        # Batch the settings so editing them does not rerun the app per widget
+        with st.form("tournament_settings", border=False):
+            col1, col2 = st.columns(2)
         
-        with col1:
-            total_players = st.number_input(
-                "Total Players",
-                min_value=2,
-                max_value=10000,
-                value=100,
-                step=1,
-                help="Total number of players that started the tournament"
-            )
+            with col1:
+                total_players = st.number_input(
+                    "Total Players",
+                    min_value=2,
+                    max_value=10000,
+                    value=100,
+                    step=1,
+                    help="Total number of players that started the tournament"
+                )
             
-            players_left = st.number_input(
-                "Players Remaining",
-                min_value=2,
-                max_value=total_players,
-                value=min(50, total_players),
-                step=1,
-                help="Number of players still in the tournament"
-            )
+                players_left = st.number_input(
+                    "Players Remaining",
+                    min_value=2,
+                    max_value=total_players,
+                    value=min(50, total_players),
+                    step=1,
+                    help="Number of players still in the tournament"
+                )
             
-            in_money_spots = st.number_input(
-                "Paid Positions",
-                min_value=1,
-                max_value=players_left,
-                value=min(9, players_left),
-                step=1,
-                help="Number of places that get paid"
-            )
+                in_money_spots = st.number_input(
+                    "Paid Positions",
+                    min_value=1,
+                    max_value=players_left,
+                    value=min(9, players_left),
+                    step=1,
+                    help="Number of places that get paid"
+                )
             
-        with col2:
-            small_blind = st.number_input(
-                "Small Blind",
-                min_value=0.0,
-                value=50.0,
-                step=10.0,
-                help="Current small blind amount"
-            )
+            with col2:
+                small_blind = st.number_input(
+                    "Small Blind",
+                    min_value=0.0,
+                    value=50.0,
+                    step=10.0,
+                    help="Current small blind amount"
+                )
+            
+                big_blind = st.number_input(
+                    "Big Blind",
+                    min_value=small_blind * 2,
+                    value=small_blind * 2,
+                    step=20.0,
+                    help="Current big blind amount"
+                )
             
-            big_blind = st.number_input(
-                "Big Blind",
-                min_value=small_blind * 2,
-                value=small_blind * 2,
-                step=20.0,
-                help="Current big blind amount"
-            )
+                avg_stack = st.number_input(
+                    "Average Stack",
+                    min_value=0.0,
+                    value=1000.0,
+                    step=100.0,
+                    help="Average stack size among remaining players"
+                )
             
-            avg_stack = st.number_input(
-                "Average Stack",
-                min_value=0.0,
-                value=1000.0,
-                step=100.0,
-                help="Average stack size among remaining players"
-            )
+            st.form_submit_button("Apply Tournament Settings", use_container_width=True)
 
         # Calculate and display key tournament metrics
         if st.session_state.stack_size > 0 and big_blind > 0:
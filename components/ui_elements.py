@@ -1,9 +1,13 @@
 import streamlit as st
 from typing import List, Tuple
 
-def inject_custom_css():
-    """Inject custom CSS for better UI appearance"""
-    st.markdown("""
+# Card selector options, shared by every selectbox on each rerun
+RANK_OPTIONS = [''] + list('23456789TJQKA')
+SUIT_OPTIONS = [''] + list('♣♦♥♠')
+SUIT_MAP = {'♣': 'c', '♦': 'd', '♥': 'h', '♠': 's'}
+
+# Built once at import; re-sent each rerun since Streamlit drops elements a rerun does not emit
+CUSTOM_CSS = """
         <style>
         /* High contrast theme */
         :root {
@@ -213,7 +217,19 @@ def inject_custom_css():
             }
         }
         </style>
-    """, unsafe_allow_html=True)
+    """
+
+def inject_custom_css():
+    """Inject custom CSS for better UI appearance"""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+def section_header(title: str, prominent: bool = False):
+    """Open a section container with its title in a single markdown write"""
+    container_class = "section-container prominent" if prominent else "section-container"
+    st.markdown(
+        f'<div class="{container_class}"><div class="section-title">{title}</div>',
+        unsafe_allow_html=True
+    )
 
 def create_stack_size_input() -> float:
     """Create a prominent stack size input"""
@@ -277,14 +293,14 @@ def create_quick_hand_selector() -> Tuple[str, str]:
     with cols[0]:
         rank1 = st.selectbox(
             'First Card',
-            [''] + list('23456789TJQKA'),
+            RANK_OPTIONS,
             key='quick_rank1',
             format_func=lambda x: x if x else 'Select Rank',
             help="Select the rank of your first card (2-A)"
         )
         suit1 = st.selectbox(
             'Suit 1',
-            [''] + list('♣♦♥♠'),
+            SUIT_OPTIONS,
             key='quick_suit1',
             format_func=lambda x: x if x else 'Select Suit',
             help="Select the suit of your first card",
@@ -294,14 +310,14 @@ def create_quick_hand_selector() -> Tuple[str, str]:
     with cols[1]:
         rank2 = st.selectbox(
             'Second Card',
-            [''] + list('23456789TJQKA'),
+            RANK_OPTIONS,
             key='quick_rank2',
             format_func=lambda x: x if x else 'Select Rank',
             help="Select the rank of your second card (2-A)"
         )
         suit2 = st.selectbox(
             'Suit 2',
-            [''] + list('♣♦♥♠'),
+            SUIT_OPTIONS,
             key='quick_suit2',
             format_func=lambda x: x if x else 'Select Suit',
             help="Select the suit of your second card",
@@ -314,14 +330,11 @@ def create_quick_hand_selector() -> Tuple[str, str]:
             return "", ""
     
     if rank1 and suit1 and rank2 and suit2:
-        suit_map = {'♣': 'c', '♦': 'd', '♥': 'h', '♠': 's'}
-        return f"{rank1}{suit_map[suit1]}", f"{rank2}{suit_map[suit2]}"
+        return f"{rank1}{SUIT_MAP[suit1]}", f"{rank2}{SUIT_MAP[suit2]}"
     return "", ""
 
 def create_betting_controls() -> Tuple[float, float]:
     """Create compact betting controls with presets"""
-    st.markdown('<div class="section-title">💰 Betting Information</div>', unsafe_allow_html=True)
-    
     cols = st.columns([1, 1])
     
     with cols[0]:
@@ -374,20 +387,19 @@ def create_community_cards_selector() -> List[str]:
         with flop_cols[i]:
             rank = st.selectbox(
                 f'Flop Card {i+1}',
-                [''] + list('23456789TJQKA'),
+                RANK_OPTIONS,
                 key=f'flop_rank{i}',
                 help=f"Select the rank of flop card {i+1}"
             )
             suit = st.selectbox(
                 f'Suit {i+1}',
-                [''] + list('♣♦♥♠'),
+                SUIT_OPTIONS,
                 key=f'flop_suit{i}',
                 help=f"Select the suit of flop card {i+1}",
                 label_visibility='collapsed'
             )
             if rank and suit:
-                suit_map = {'♣': 'c', '♦': 'd', '♥': 'h', '♠': 's'}
-                community_cards.append(f"{rank}{suit_map[suit]}")
+                community_cards.append(f"{rank}{SUIT_MAP[suit]}")
     
     if len(community_cards) == 3:
         st.markdown('<div class="street-separator"></div>', unsafe_allow_html=True)
@@ -396,20 +408,19 @@ def create_community_cards_selector() -> List[str]:
         with turn_col1:
             rank = st.selectbox(
                 'Turn Card',
-                [''] + list('23456789TJQKA'),
+                RANK_OPTIONS,
                 key='turn_rank',
                 help="Select the rank of the turn card"
             )
             suit = st.selectbox(
                 'Turn Suit',
-                [''] + list('♣♦♥♠'),
+                SUIT_OPTIONS,
                 key='turn_suit',
                 help="Select the suit of the turn card",
                 label_visibility='collapsed'
             )
             if rank and suit:
-                suit_map = {'♣': 'c', '♦': 'd', '♥': 'h', '♠': 's'}
-                community_cards.append(f"{rank}{suit_map[suit]}")
+                community_cards.append(f"{rank}{SUIT_MAP[suit]}")
     
     if len(community_cards) == 4:
         st.markdown('<div class="street-separator"></div>', unsafe_allow_html=True)
@@ -418,20 +429,19 @@ def create_community_cards_selector() -> List[str]:
         with river_col1:
             rank = st.selectbox(
                 'River Card',
-                [''] + list('23456789TJQKA'),
+                RANK_OPTIONS,
                 key='river_rank',
                 help="Select the rank of the river card"
             )
             suit = st.selectbox(
                 'River Suit',
-                [''] + list('♣♦♥♠'),
+                SUIT_OPTIONS,
                 key='river_suit',
                 help="Select the suit of the river card",
                 label_visibility='collapsed'
             )
             if rank and suit:
-                suit_map = {'♣': 'c', '♦': 'd', '♥': 'h', '♠': 's'}
-                community_cards.append(f"{rank}{suit_map[suit]}")
+                community_cards.append(f"{rank}{SUIT_MAP[suit]}")
     
     st.markdown('</div>', unsafe_allow_html=True)
     return community_cards
@@ -1,11 +1,13 @@
+import os
+# Regions are OCR'd concurrently, so keep each tesseract call single-threaded;
+# OpenMP reads this when tesserocr loads, so it must be set before any import below
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
 import streamlit as st
-from poker.evaluator import HandEvaluator
-from poker.calculator import PokerCalculator
-from poker.recommendations import RecommendationEngine
-from poker.ai_analysis import AIAnalysis
 from utils.monitoring import monitor
 from components.ui_elements import (
     inject_custom_css,
+    section_header,
     create_quick_start_guide,
     create_stack_size_input,
     create_quick_position_selector,
@@ -18,33 +20,106 @@ from components.ui_elements import (
 from components.tournament_ui import create_tournament_controls
 from components.screen_capture_ui import create_screen_capture_controls
 import atexit
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Hand potential sample budget by number of board cards (None = exact enumeration)
+POTENTIAL_SAMPLES = {0: 100, 3: 500, 4: None}
+
+@st.cache_resource
+def get_ai_analyzer():
+    """Get the shared AI analyzer (imported lazily, pulls in openai)"""
+    from poker.ai_analysis import AIAnalysis
+    return AIAnalysis()
+
+@st.cache_resource
+def get_db_writer() -> ThreadPoolExecutor:
+    """Get the single writer thread for hand history, so database writes never block a rerun"""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-writer')
+    # Created once per process, so the shutdown is registered once too
+    atexit.register(executor.shutdown, wait=True)
+    return executor
+
+def log_write_error(future: Future):
+    """Done-callback for background writes, so failures are logged instead of dropped"""
+    error = future.exception()
+    if error is not None:
+        logging.getLogger('PokerAssistant').error(f"Failed to record hand: {error}")
+
+@st.cache_resource
+def get_hand_recorder():
+    """Get the database used only by the get_db_writer thread (its session is not thread-safe)"""
+    from poker.database import Database
+    return Database()
+
+@st.cache_resource
+def get_engine():
+    """Get the shared recommendation engine (imported lazily)"""
+    from poker.recommendations import get_recommendation_engine
+    return get_recommendation_engine()
+
+@st.cache_resource
+def get_evaluator():
+    """Get the shared hand evaluator (imported lazily)"""
+    from poker.evaluator import HandEvaluator
+    return HandEvaluator()
+
+@st.cache_resource
+def get_calculator():
+    """Get the shared pot odds calculator (imported lazily)"""
+    from poker.calculator import PokerCalculator
+    return PokerCalculator()
+
+@st.cache_data(show_spinner=False)
+def get_hand_strength(hole_cards: tuple, community_cards: tuple) -> float:
+    """Cached hand strength for a given set of cards"""
+    return get_evaluator().evaluate_hand_strength(list(hole_cards), list(community_cards))
+
+@st.cache_data(show_spinner=False)
+def get_hand_potential(hole_cards: tuple, community_cards: tuple, max_samples) -> tuple:
+    """Cached positive/negative hand potential for a given set of cards"""
+    return get_evaluator().calculate_hand_potential(
+        list(hole_cards), list(community_cards), max_samples=max_samples
+    )
+
+# Default session state, applied once per session
+SESSION_DEFAULTS = {
+    'hole_cards': (),
+    'minimal_mode': False,
+    'window_docked': False,
+    'loading': False,
+    'stack_size': 100.0,
+    'selected_position': None,
+    'player_id': "default_player",
+    'screen_capture_enabled': False,
+    'automated_mode': False
+}
 
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'hole_cards' not in st.session_state:
-        st.session_state.hole_cards = []
-    if 'minimal_mode' not in st.session_state:
-        st.session_state.minimal_mode = False
-    if 'window_docked' not in st.session_state:
-        st.session_state.window_docked = False
-    if 'loading' not in st.session_state:
-        st.session_state.loading = False
-    if 'stack_size' not in st.session_state:
-        st.session_state.stack_size = 100.0
-    if 'selected_position' not in st.session_state:
-        st.session_state.selected_position = None
-    if 'player_id' not in st.session_state:
-        st.session_state.player_id = "default_player"
-    if 'screen_capture_enabled' not in st.session_state:
-        st.session_state.screen_capture_enabled = False
-    if 'automated_mode' not in st.session_state:
-        st.session_state.automated_mode = False
+    if not st.session_state.get('_initialized'):
+        st.session_state.update({**SESSION_DEFAULTS, '_initialized': True})
+
+def get_data_version() -> tuple:
+    """Current hand history version, read on a short-lived session"""
+    from poker.database import Database
+    db = Database()
+    try:
+        return db.get_data_version()
+    finally:
+        db.close()
 
+@st.cache_data(ttl=300, show_spinner=False)
+def get_player_profile(player_id: str, data_version: tuple) -> dict:
+    """Get the analyzed player profile, re-run only when new data is recorded or the TTL expires"""
+    return get_ai_analyzer().update_player_profile(player_id)
+
+@st.fragment
 def display_player_profile():
     """Display player profile and analysis"""
     if st.session_state.player_id:
-        ai_analyzer = AIAnalysis()
-        profile_data = ai_analyzer.update_player_profile(st.session_state.player_id)
+        data_version = get_data_version()
+        profile_data = get_player_profile(st.session_state.player_id, data_version)
         
         if 'error' not in profile_data:
             st.markdown("### 📊 Player Profile Analysis")
@@ -58,9 +133,39 @@ def display_player_profile():
                 st.metric("Showdown Frequency", f"{profile_data['stats']['showdown_frequency']:.1%}")
             
             with st.expander("🤖 AI Analysis", expanded=False):
-                if 'analysis' in profile_data:
+                if st.button("🔄 Refresh Analysis", key='refresh_analysis'):
+                    # Render tokens as they arrive instead of waiting for the full response
+                    st.write_stream(get_ai_analyzer().stream_player_profile(profile_data['stats']))
+                elif 'analysis' in profile_data:
                     st.markdown(profile_data['analysis'].get('analysis', ''))
 
+@st.fragment
+def display_statistics(hole_cards: tuple, community_cards: tuple, to_call: float, pot: float):
+    """Display detailed hand statistics, rerunning only this fragment on toggle"""
+    # Only compute statistics when the panel is open
+    if not st.checkbox("📊 Detailed Statistics", key='stats_open'):
+        return
+    
+    strength = get_hand_strength(hole_cards, community_cards)
+    pot_odds = get_calculator().calculate_pot_odds(to_call, pot)
+    
+    stats = {
+        "Hand Strength 💪": f"{strength:.1%}",
+        "Pot Odds 🎲": f"{pot_odds:.1%}"
+    }
+    
+    if len(community_cards) < 5:
+        pos_pot, neg_pot = get_hand_potential(
+            hole_cards,
+            community_cards,
+            POTENTIAL_SAMPLES.get(len(community_cards), 100)
+        )
+        stats["Positive Potential 📈"] = f"{pos_pot:.1%}"
+        stats["Negative Potential 📉"] = f"{neg_pot:.1%}"
+    
+    # Render all statistics as a single element
+    st.table({"Statistic": list(stats.keys()), "Value": list(stats.values())})
+
 def cleanup():
     """Cleanup function to stop monitoring when the app exits"""
     monitor.stop_monitoring()
@@ -118,31 +223,27 @@ def main():
         tournament_info = create_tournament_controls()
         
         # Stack Size Section
-        st.markdown('<div class="section-container prominent">', unsafe_allow_html=True)
-        st.markdown('<div class="section-title">💰 Stack Size</div>', unsafe_allow_html=True)
+        section_header("💰 Stack Size", prominent=True)
         stack = create_stack_size_input()
         
         # Position Selection
-        st.markdown('<div class="section-container">', unsafe_allow_html=True)
-        st.markdown('<div class="section-title">🎯 Table Position</div>', unsafe_allow_html=True)
+        section_header("🎯 Table Position")
         position = create_quick_position_selector()
         
         # Hole Cards Selection
-        st.markdown('<div class="section-container">', unsafe_allow_html=True)
-        st.markdown('<div class="section-title">🎴 Your Hand</div>', unsafe_allow_html=True)
+        section_header("🎴 Your Hand")
         card1, card2 = create_quick_hand_selector()
         if card1 and card2 and card1 != card2:
-            st.session_state.hole_cards = [card1, card2]
+            st.session_state.hole_cards = (card1, card2)
             if not st.session_state.minimal_mode:
                 st.success("Hand selected successfully!")
         
         # Betting Information
-        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        section_header("💰 Betting Information")
         pot, to_call = create_betting_controls()
         
         # Community Cards
-        st.markdown('<div class="section-container">', unsafe_allow_html=True)
-        st.markdown('<div class="section-title">🃏 Community Cards</div>', unsafe_allow_html=True)
+        section_header("🃏 Community Cards")
         community_cards = create_community_cards_selector()
         
         # Get Recommendation Button
@@ -167,57 +268,50 @@ def main():
                 st.session_state.loading = True
                 st.markdown('<div class="loading">Calculating optimal play...</div>', unsafe_allow_html=True)
                 
-                engine = RecommendationEngine()
-                recommendation = engine.get_recommendation(
+                # Reuse the last recommendation when the inputs are unchanged
+                fingerprint = (
                     st.session_state.hole_cards,
-                    community_cards,
+                    tuple(community_cards),
                     position,
                     pot,
                     to_call,
                     stack,
-                    tournament_info=tournament_info
+                    tuple(sorted(tournament_info.items())) if tournament_info else None
                 )
+                inputs_changed = st.session_state.get('last_fingerprint') != fingerprint
+                if inputs_changed:
+                    engine = get_engine()
+                    st.session_state.last_rec = engine.get_recommendation(
+                        st.session_state.hole_cards,
+                        community_cards,
+                        position,
+                        pot,
+                        to_call,
+                        stack,
+                        tournament_info=tournament_info
+                    )
+                    st.session_state.last_fingerprint = fingerprint
+                recommendation = st.session_state.last_rec
                 
                 st.session_state.loading = False
                 display_recommendation(recommendation, st.session_state.minimal_mode)
                 
-                # Record the hand in the database
-                ai_analyzer = AIAnalysis()
-                ai_analyzer.db.record_hand(
-                    position=position,
-                    hole_cards=st.session_state.hole_cards,
-                    community_cards=community_cards,
-                    action_taken=recommendation['action'],
-                    pot_size=pot,
-                    stack_size=stack
-                )
+                # Record each distinct hand once, without blocking the rerun
+                if inputs_changed:
+                    write = get_db_writer().submit(
+                        get_hand_recorder().record_hand,
+                        position=position,
+                        hole_cards=st.session_state.hole_cards,
+                        community_cards=community_cards,
+                        action_taken=recommendation['action'],
+                        pot_size=pot,
+                        stack_size=stack
+                    )
+                    write.add_done_callback(log_write_error)
     
         # Statistics section
         if not st.session_state.minimal_mode and st.session_state.hole_cards:
-            with st.expander("📊 Detailed Statistics", expanded=False):
-                evaluator = HandEvaluator()
-                calculator = PokerCalculator()
-                
-                strength = evaluator.evaluate_hand_strength(
-                    st.session_state.hole_cards,
-                    community_cards
-                )
-                
-                pot_odds = calculator.calculate_pot_odds(to_call, pot)
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Hand Strength 💪", f"{strength:.1%}")
-                    st.metric("Pot Odds 🎲", f"{pot_odds:.1%}")
-                
-                if len(community_cards) < 5:
-                    with col2:
-                        pos_pot, neg_pot = evaluator.calculate_hand_potential(
-                            st.session_state.hole_cards,
-                            community_cards
-                        )
-                        st.metric("Positive Potential 📈", f"{pos_pot:.1%}")
-                        st.metric("Negative Potential 📉", f"{neg_pot:.1%}")
+            display_statistics(st.session_state.hole_cards, tuple(community_cards), to_call, pot)
     
     st.markdown('</div>', unsafe_allow_html=True)
 
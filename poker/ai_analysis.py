@@ -1,23 +1,60 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import openai
 import os
+from functools import lru_cache
 from datetime import datetime
-from .database import Database
+from .database import Database, PlayerProfile
 import json
 
+@lru_cache(maxsize=1)
+def get_openai_client() -> Optional[openai.OpenAI]:
+    """Get the process-wide OpenAI client so its connection pool is reused (None without an API key)"""
+    api_key = os.environ.get('OPENAI_API_KEY')
+    return openai.OpenAI(api_key=api_key) if api_key else None
+
 class AIAnalysis:
+    # Statistical summaries do not need a large model
+    MODEL = "gpt-4o-mini"
+    TEMPERATURE = 0.3
+    MAX_TOKENS = 300
+    # Seconds a stored profile analysis stays fresh
+    PROFILE_TTL = 600
+
     def __init__(self):
-        self.client = openai.OpenAI(api_key=os.environ['OPENAI_API_KEY'])
-        self.db = Database()
+        self.client = get_openai_client()
+        self.enabled = self.client is not None
 
-    def analyze_player_profile(self, player_stats: Dict) -> Dict:
-        """Analyze player statistics using OpenAI API"""
-        prompt = f"""
+    def _disabled_result(self) -> Dict:
+        """Result returned by every analysis when no OpenAI API key is configured"""
+        return {
+            'error': 'OPENAI_API_KEY is not set',
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+    def _format_value(self, value) -> str:
+        """Format a single prompt value compactly"""
+        return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+    def _format_mapping(self, data: Dict) -> str:
+        """Format a flat mapping as 'key=value, ...' (fewer prompt tokens than JSON)"""
+        return ", ".join(f"{k}={self._format_value(v)}" for k, v in data.items())
+
+    def _format_records(self, records: List[Dict]) -> str:
+        """Format a list of flat mappings as one '- key=value, ...' line each"""
+        return "\n".join(f"- {self._format_mapping(record)}" for record in records)
+
+    def _format_table(self, table: Dict[str, Dict]) -> str:
+        """Format a mapping of rows as one '- name: key=value, ...' line each"""
+        return "\n".join(f"- {name}: {self._format_mapping(row)}" for name, row in table.items())
+
+    def _player_profile_prompt(self, player_stats: Dict) -> str:
+        """Build the player statistics analysis prompt"""
+        return f"""
         Analyze the following poker player statistics and provide strategic insights:
         
         Total Hands: {player_stats['total_hands']}
-        Position Distribution: {json.dumps(player_stats['positions'])}
-        Action Distribution: {json.dumps(player_stats['actions'])}
+        Position Distribution: {self._format_mapping(player_stats['positions'])}
+        Action Distribution: {self._format_mapping(player_stats['actions'])}
         Profit/Loss: ${player_stats['profit_loss']:.2f}
         Showdown Frequency: {player_stats['showdown_frequency']:.2%}
         
@@ -28,9 +65,15 @@ class AIAnalysis:
         4. Recommended adjustments
         """
 
+    def analyze_player_profile(self, player_stats: Dict) -> Dict:
+        """Analyze player statistics using OpenAI API"""
+        if not self.enabled:
+            return self._disabled_result()
+        prompt = self._player_profile_prompt(player_stats)
+
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.MODEL,
                 messages=[{
                     "role": "system",
                     "content": "You are a poker strategy expert analyzing player statistics."
@@ -38,8 +81,8 @@ class AIAnalysis:
                     "role": "user",
                     "content": prompt
                 }],
-                temperature=0.7,
-                max_tokens=500
+                temperature=self.TEMPERATURE,
+                max_tokens=self.MAX_TOKENS
             )
             
             analysis = response.choices[0].message.content
@@ -53,11 +96,38 @@ class AIAnalysis:
                 'timestamp': datetime.utcnow().isoformat()
             }
 
+    def stream_player_profile(self, player_stats: Dict) -> Iterator[str]:
+        """Stream the player statistics analysis as it is generated"""
+        if not self.enabled:
+            yield "AI analysis is unavailable: OPENAI_API_KEY is not set."
+            return
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.MODEL,
+                messages=[{
+                    "role": "system",
+                    "content": "You are a poker strategy expert analyzing player statistics."
+                }, {
+                    "role": "user",
+                    "content": self._player_profile_prompt(player_stats)
+                }],
+                temperature=self.TEMPERATURE,
+                max_tokens=self.MAX_TOKENS,
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        except Exception as e:
+            yield f"Analysis failed: {str(e)}"
+
     def get_opponent_model(self, opponent_actions: List[Dict]) -> Dict:
         """Generate opponent modeling insights"""
+        if not self.enabled:
+            return self._disabled_result()
         prompt = f"""
         Analyze the following opponent actions and provide strategic insights:
-        {json.dumps(opponent_actions, indent=2)}
+        {self._format_records(opponent_actions)}
         
         Focus on:
         1. Betting patterns
@@ -69,7 +139,7 @@ class AIAnalysis:
 
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.MODEL,
                 messages=[{
                     "role": "system",
                     "content": "You are a poker strategy expert analyzing opponent behavior."
@@ -77,8 +147,8 @@ class AIAnalysis:
                     "role": "user",
                     "content": prompt
                 }],
-                temperature=0.7,
-                max_tokens=500
+                temperature=self.TEMPERATURE,
+                max_tokens=self.MAX_TOKENS
             )
             
             analysis = response.choices[0].message.content
@@ -94,9 +164,11 @@ class AIAnalysis:
 
     def get_hand_history_insights(self, hand_type_performance: Dict) -> Dict:
         """Analyze hand history performance"""
+        if not self.enabled:
+            return self._disabled_result()
         prompt = f"""
         Analyze the following hand type performance data and provide strategic insights:
-        {json.dumps(hand_type_performance, indent=2)}
+        {self._format_table(hand_type_performance)}
         
         Provide recommendations on:
         1. Most profitable hand types
@@ -107,7 +179,7 @@ class AIAnalysis:
 
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.MODEL,
                 messages=[{
                     "role": "system",
                     "content": "You are a poker strategy expert analyzing hand history data."
@@ -115,8 +187,8 @@ class AIAnalysis:
                     "role": "user",
                     "content": prompt
                 }],
-                temperature=0.7,
-                max_tokens=500
+                temperature=self.TEMPERATURE,
+                max_tokens=self.MAX_TOKENS
             )
             
             analysis = response.choices[0].message.content
@@ -130,13 +202,90 @@ class AIAnalysis:
                 'timestamp': datetime.utcnow().isoformat()
             }
 
+    def analyze_combined(self, player_stats: Dict, hand_type_performance: Dict) -> Tuple[Dict, Dict]:
+        """Analyze player statistics and hand history performance in a single request"""
+        if not self.enabled:
+            return self._disabled_result(), self._disabled_result()
+        prompt = f"""
+        Analyze the following poker player statistics and hand type performance data.
+        
+        Total Hands: {player_stats['total_hands']}
+        Position Distribution: {self._format_mapping(player_stats['positions'])}
+        Action Distribution: {self._format_mapping(player_stats['actions'])}
+        Profit/Loss: ${player_stats['profit_loss']:.2f}
+        Showdown Frequency: {player_stats['showdown_frequency']:.2%}
+        
+        Hand Type Performance:
+        {self._format_table(hand_type_performance)}
+        
+        Return a JSON object with two string fields:
+        "analysis": a concise player analysis covering playing style (aggressive/passive,
+        tight/loose), position-based tendencies, key strengths and weaknesses, and
+        recommended adjustments.
+        "insights": hand history recommendations covering the most profitable hand types,
+        hands to avoid or play differently, position-specific hand selection, and
+        suggested adjustments to current strategy.
+        """
+
+        timestamp = datetime.utcnow().isoformat()
+        try:
+            response = self.client.chat.completions.create(
+                model=self.MODEL,
+                messages=[{
+                    "role": "system",
+                    "content": "You are a poker strategy expert analyzing player statistics and hand history data."
+                }, {
+                    "role": "user",
+                    "content": prompt
+                }],
+                response_format={"type": "json_object"},
+                temperature=self.TEMPERATURE,
+                max_tokens=2 * self.MAX_TOKENS
+            )
+            
+            result = json.loads(response.choices[0].message.content)
+            return (
+                {'analysis': result.get('analysis', ''), 'timestamp': timestamp},
+                {'insights': result.get('insights', ''), 'timestamp': timestamp}
+            )
+        except Exception as e:
+            error = {'error': str(e), 'timestamp': timestamp}
+            return error, dict(error)
+
     def update_player_profile(self, player_id: str) -> Dict:
         """Update player profile with latest analysis"""
-        stats = self.db.get_player_stats()
-        hand_performance = self.db.get_hand_type_performance()
+        # A short-lived session per call: the analyzer is shared across threads, sessions are not thread-safe
+        db = Database()
+        try:
+            return self._update_player_profile(db, player_id)
+        finally:
+            db.close()
+
+    def _update_player_profile(self, db: Database, player_id: str) -> Dict:
+        """update_player_profile on an already open database session"""
+        stats, hand_performance = db.get_player_stats_and_hand_perf()
+        
+        # Stats are cheap and always recomputed; reuse a recently stored AI analysis instead of calling OpenAI again
+        stored = None
+        try:
+            profile = db.session.query(PlayerProfile).filter_by(player_id=player_id).first()
+            if (profile and profile.stats and profile.last_updated and
+                    (datetime.utcnow() - profile.last_updated).total_seconds() < self.PROFILE_TTL):
+                stored = profile.stats
+        except Exception:
+            db.session.rollback()
         
-        profile_analysis = self.analyze_player_profile(stats)
-        hand_insights = self.get_hand_history_insights(hand_performance)
+        if (stored and 'analysis' in stored and 'hand_insights' in stored and
+                'error' not in stored['analysis'] and 'error' not in stored['hand_insights']):
+            return {
+                'stats': stats,
+                'hand_performance': hand_performance,
+                'analysis': stored['analysis'],
+                'hand_insights': stored['hand_insights'],
+                'last_updated': stored.get('last_updated')
+            }
+        
+        profile_analysis, hand_insights = self.analyze_combined(stats, hand_performance)
         
         profile_data = {
             'stats': stats,
@@ -146,17 +295,14 @@ class AIAnalysis:
             'last_updated': datetime.utcnow().isoformat()
         }
         
+        # Failed analyses are returned but not stored, so the next call retries instead of reusing the error
+        if 'error' in profile_analysis or 'error' in hand_insights:
+            return profile_data
+        
         # Store updated profile in database
         try:
-            profile = self.db.session.query(self.db.PlayerProfile).filter_by(player_id=player_id).first()
-            if not profile:
-                profile = self.db.PlayerProfile(player_id=player_id)
-            
-            profile.stats = profile_data
-            profile.last_updated = datetime.utcnow()
-            self.db.session.add(profile)
-            self.db.session.commit()
-            
+            db.save_player_profile(player_id, profile_data)
             return profile_data
         except Exception as e:
+            db.session.rollback()
             return {'error': str(e)}
@@ -1,25 +1,36 @@
-from typing import Dict
+from typing import Dict, Union
 import numpy as np
 
+ArrayLike = Union[float, np.ndarray]
+
+# Position weights used by position_multiplier
+POSITION_WEIGHTS = {
+    'BTN': 1.2,
+    'CO': 1.1,
+    'MP': 0.9,
+    'EP': 0.8,
+    'BB': 0.85,
+    'SB': 0.75
+}
+
 class PokerCalculator:
-    def calculate_pot_odds(self, to_call: float, pot_size: float) -> float:
-        """Calculate pot odds"""
-        if pot_size == 0 or to_call == 0:
-            return 0.0
-        return to_call / (pot_size + to_call)
+    def calculate_pot_odds(self, to_call: ArrayLike, pot_size: ArrayLike) -> ArrayLike:
+        """Calculate pot odds (scalars or element-wise over arrays)"""
+        if np.isscalar(to_call) and np.isscalar(pot_size):
+            if pot_size == 0 or to_call == 0:
+                return 0.0
+            return to_call / (pot_size + to_call)
+        
+        to_call = np.asarray(to_call, dtype=float)
+        pot_size = np.asarray(pot_size, dtype=float)
+        total = pot_size + to_call
+        valid = (pot_size != 0) & (to_call != 0)
+        return np.divide(to_call, total, out=np.zeros(np.broadcast(to_call, pot_size).shape), where=valid)
 
-    def calculate_ev(self, win_probability: float, pot_size: float, to_call: float) -> float:
-        """Calculate expected value of a call"""
+    def calculate_ev(self, win_probability: ArrayLike, pot_size: ArrayLike, to_call: ArrayLike) -> ArrayLike:
+        """Calculate expected value of a call (scalars or element-wise over arrays)"""
         return (win_probability * pot_size) - ((1 - win_probability) * to_call)
 
     def position_multiplier(self, position: str) -> float:
         """Get multiplier based on position"""
-        position_weights = {
-            'BTN': 1.2,
-            'CO': 1.1,
-            'MP': 0.9,
-            'EP': 0.8,
-            'BB': 0.85,
-            'SB': 0.75
-        }
-        return position_weights.get(position, 1.0)
+        return POSITION_WEIGHTS.get(position, 1.0)
@@ -1,35 +1,69 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, JSON, Boolean as SQLBoolean
+from sqlalchemy import create_engine, event, inspect, text, func, case, distinct, Index, Column, Integer, String, Float, DateTime, ForeignKey, JSON, Boolean as SQLBoolean
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker, relationship, selectinload, raiseload
 from datetime import datetime
 import os
-import json
+import time
+import orjson
+from threading import Lock
+from functools import lru_cache
 
 Base = declarative_base()
 
+def _json_dumps(value) -> str:
+    """orjson-backed serializer for JSON columns (stdlib json is several times slower)"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+# JSON column type: binary JSONB on Postgres, textual JSON elsewhere
+JSON_TYPE = JSON().with_variant(postgresql.JSONB(), 'postgresql')
+
+# Dialect-specific INSERTs that support ON CONFLICT DO UPDATE
+UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert
+}
+
+def encode_cards(cards) -> str:
+    """Store cards as a fixed-width string of 2-char cards, e.g. ['Ah', 'Ks'] -> 'AhKs'"""
+    return ''.join(cards)
+
+def decode_cards(value: str) -> list:
+    """Split a stored card string back into cards (rows written before encode_cards hold JSON)"""
+    if not value:
+        return []
+    if value[0] == '[':
+        return orjson.loads(value)
+    return [value[i:i + 2] for i in range(0, len(value), 2)]
+
 class Hand(Base):
     __tablename__ = 'hands'
     
     id = Column(Integer, primary_key=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
     position = Column(String)
-    hole_cards = Column(String)  # JSON string of hole cards
-    community_cards = Column(String)  # JSON string of community cards
+    hole_cards = Column(String)  # Concatenated 2-char cards, e.g. 'AhKs'
+    community_cards = Column(String)  # Concatenated 2-char cards
     action_taken = Column(String)
     pot_size = Column(Float)
     stack_size = Column(Float)
+    hand_type = Column(String, index=True)  # Hole card classification, computed at write time
     
     result = relationship("Result", back_populates="hand", uselist=False)
     player_actions = relationship("PlayerAction", back_populates="hand")
+    
+    __table_args__ = (
+        Index('ix_hands_pos_ts', 'position', 'timestamp'),
+    )
 
 class Result(Base):
     __tablename__ = 'results'
     
     id = Column(Integer, primary_key=True)
-    hand_id = Column(Integer, ForeignKey('hands.id'))
+    hand_id = Column(Integer, ForeignKey('hands.id'), index=True)
     profit_loss = Column(Float)
     showdown_reached = Column(SQLBoolean, default=False)
-    opponent_cards = Column(String, nullable=True)  # JSON string of opponent cards if shown
+    opponent_cards = Column(String, nullable=True)  # Concatenated 2-char opponent cards if shown
     
     hand = relationship("Hand", back_populates="result")
 
@@ -37,7 +71,7 @@ class PlayerAction(Base):
     __tablename__ = 'player_actions'
     
     id = Column(Integer, primary_key=True)
-    hand_id = Column(Integer, ForeignKey('hands.id'))
+    hand_id = Column(Integer, ForeignKey('hands.id'), index=True)
     street = Column(String)  # preflop, flop, turn, river
     action_type = Column(String)  # bet, raise, call, fold
     amount = Column(Float)
@@ -50,8 +84,8 @@ class PlayerProfile(Base):
     
     id = Column(Integer, primary_key=True)
     player_id = Column(String, unique=True)
-    stats = Column(JSON)  # Store aggregated statistics
-    tendencies = Column(JSON)  # Store identified patterns
+    stats = Column(JSON_TYPE)  # Store aggregated statistics
+    tendencies = Column(JSON_TYPE)  # Store identified patterns
     last_updated = Column(DateTime, default=datetime.utcnow)
 
 class AutomatedCapture(Base):
@@ -63,50 +97,116 @@ class AutomatedCapture(Base):
     active_position = Column(String)
     pot_size = Column(Float)
     current_bet = Column(Float)
-    player_stacks = Column(JSON)  # Store stack sizes for all positions
-    detected_cards = Column(JSON)  # Store all detected cards
-    action_history = Column(JSON)  # Store sequence of actions
+    player_stacks = Column(JSON_TYPE)  # Store stack sizes for all positions
+    detected_cards = Column(JSON_TYPE)  # Store all detected cards
+    action_history = Column(JSON_TYPE)  # Store sequence of actions
     confidence_score = Column(Float)  # OCR confidence level
 
+@lru_cache(maxsize=1)
+def get_db_engine():
+    """Get the process-wide engine so every Database shares one connection pool"""
+    url = os.environ['DATABASE_URL']
+    if url.startswith('sqlite'):
+        engine = create_engine(url, connect_args={'check_same_thread': False},
+                               json_serializer=_json_dumps, json_deserializer=orjson.loads)
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
+    else:
+        engine = create_engine(url, pool_size=10, pool_pre_ping=True,
+                               json_serializer=_json_dumps, json_deserializer=orjson.loads)
+    Base.metadata.create_all(engine)
+    _migrate_schema(engine)
+    return engine
+
+def _migrate_schema(engine):
+    """Bring tables created by older versions up to date (create_all never alters existing tables)"""
+    columns = {column['name'] for column in inspect(engine).get_columns('hands')}
+    if 'hand_type' not in columns:
+        with engine.begin() as connection:
+            connection.execute(text('ALTER TABLE hands ADD COLUMN hand_type VARCHAR'))
+    
+    # Indexes added after the tables were first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling so writes don't block readers and need fewer fsyncs"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
 class Database:
+    # Buffered capture rows are written in one executemany once this many are pending,
+    # or once the oldest has waited FLUSH_INTERVAL seconds
+    BATCH_SIZE = 50
+    FLUSH_INTERVAL = 5.0
+
     def __init__(self):
-        self.engine = create_engine(os.environ['DATABASE_URL'])
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
+        self.engine = get_db_engine()
+        # Writes commit explicitly and loaded rows stay valid after commit
+        Session = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)
         self.session = Session()
+        self._pending_captures = []
+        self._pending_since = 0.0
+        # Captures are buffered from the capture thread and flushed from the UI thread on stop
+        self._pending_lock = Lock()
+    
+    def _buffer_capture(self, row: dict):
+        """Queue a capture row, flushing once the batch is full or the oldest row is due"""
+        with self._pending_lock:
+            if not self._pending_captures:
+                self._pending_since = time.monotonic()
+            self._pending_captures.append(row)
+            due = (len(self._pending_captures) >= self.BATCH_SIZE or
+                   time.monotonic() - self._pending_since >= self.FLUSH_INTERVAL)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Insert all buffered capture rows with one executemany and a single commit"""
+        with self._pending_lock:
+            if not self._pending_captures:
+                return
+            self.session.execute(AutomatedCapture.__table__.insert(), self._pending_captures)
+            self._pending_captures = []
+            self.session.commit()
     
     def record_automated_capture(self, position: str, active_position: str,
                                pot_size: float, current_bet: float,
                                player_stacks: dict, detected_cards: dict,
-                               action_history: list, confidence_score: float) -> AutomatedCapture:
-        """Record an automated screen capture analysis"""
-        capture = AutomatedCapture(
-            position=position,
-            active_position=active_position,
-            pot_size=pot_size,
-            current_bet=current_bet,
-            player_stacks=json.dumps(player_stacks),
-            detected_cards=json.dumps(detected_cards),
-            action_history=json.dumps(action_history),
-            confidence_score=confidence_score
-        )
-        self.session.add(capture)
-        self.session.commit()
-        return capture
+                               action_history: list, confidence_score: float):
+        """Record an automated screen capture analysis (buffered until flush)"""
+        self._buffer_capture({
+            'position': position,
+            'active_position': active_position,
+            'pot_size': pot_size,
+            'current_bet': current_bet,
+            'player_stacks': player_stacks,
+            'detected_cards': detected_cards,
+            'action_history': action_history,
+            'confidence_score': confidence_score
+        })
 
     def record_hand(self, position: str, hole_cards: list, community_cards: list,
                    action_taken: str, pot_size: float, stack_size: float) -> Hand:
         """Record a new hand in the database"""
         hand = Hand(
             position=position,
-            hole_cards=json.dumps(hole_cards),
-            community_cards=json.dumps(community_cards),
+            hole_cards=encode_cards(hole_cards),
+            community_cards=encode_cards(community_cards),
             action_taken=action_taken,
             pot_size=pot_size,
-            stack_size=stack_size
+            stack_size=stack_size,
+            hand_type=self._classify_hand_type(hole_cards)
         )
         self.session.add(hand)
-        self.session.commit()
+        try:
+            self.session.commit()
+        except Exception:
+            # Leave the session usable for the next hand
+            self.session.rollback()
+            raise
         return hand
 
     def record_result(self, hand_id: int, profit_loss: float,
@@ -116,7 +216,7 @@ class Database:
             hand_id=hand_id,
             profit_loss=profit_loss,
             showdown_reached=showdown_reached,
-            opponent_cards=json.dumps(opponent_cards) if opponent_cards else None
+            opponent_cards=encode_cards(opponent_cards) if opponent_cards else None
         )
         self.session.add(result)
         self.session.commit()
@@ -134,40 +234,139 @@ class Database:
         self.session.add(action)
         self.session.commit()
 
+    def save_player_profile(self, player_id: str, stats: dict):
+        """Insert or update a player profile in a single upsert statement"""
+        upsert_insert = UPSERT_INSERTS.get(self.engine.dialect.name)
+        if upsert_insert is None:
+            profile = self.session.query(PlayerProfile).filter_by(player_id=player_id).first()
+            if not profile:
+                profile = PlayerProfile(player_id=player_id)
+            profile.stats = stats
+            profile.last_updated = datetime.utcnow()
+            self.session.add(profile)
+            self.session.commit()
+            return
+        
+        stmt = upsert_insert(PlayerProfile).values(
+            player_id=player_id,
+            stats=stats,
+            last_updated=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PlayerProfile.player_id],
+            set_={'stats': stmt.excluded.stats, 'last_updated': stmt.excluded.last_updated}
+        )
+        self.session.execute(stmt)
+        self.session.commit()
+        # The upsert bypasses the ORM, so a loaded profile would otherwise stay stale
+        self.session.expire_all()
+
     def get_player_stats(self, position: str = None, last_n_hands: int = None) -> dict:
         """Get aggregated statistics for hands played"""
-        query = self.session.query(Hand)
+        self.flush()
+        hands = self.session.query(Hand.id, Hand.position, Hand.action_taken)
         if position:
-            query = query.filter(Hand.position == position)
+            hands = hands.filter(Hand.position == position)
         if last_n_hands:
-            query = query.order_by(Hand.timestamp.desc()).limit(last_n_hands)
+            hands = hands.order_by(Hand.timestamp.desc()).limit(last_n_hands)
+        hands = hands.subquery()
         
-        hands = query.all()
+        # Aggregate per (position, action) in the database instead of per hand in Python
+        groups = self.session.query(
+            hands.c.position,
+            hands.c.action_taken,
+            func.count(distinct(hands.c.id)),
+            func.sum(Result.profit_loss),
+            func.sum(case((Result.showdown_reached, 1), else_=0))
+        ).outerjoin(Result, Result.hand_id == hands.c.id).group_by(
+            hands.c.position, hands.c.action_taken
+        ).all()
         
         stats = {
-            'total_hands': len(hands),
+            'total_hands': 0,
             'positions': {},
             'actions': {},
             'profit_loss': 0.0,
             'showdown_frequency': 0.0
         }
         
-        for hand in hands:
-            stats['positions'][hand.position] = stats['positions'].get(hand.position, 0) + 1
-            stats['actions'][hand.action_taken] = stats['actions'].get(hand.action_taken, 0) + 1
-            if hand.result:
-                stats['profit_loss'] += hand.result.profit_loss
-                if hand.result.showdown_reached:
-                    stats['showdown_frequency'] += 1
+        for hand_position, action_taken, count, profit_loss, showdowns in groups:
+            stats['total_hands'] += count
+            stats['positions'][hand_position] = stats['positions'].get(hand_position, 0) + count
+            stats['actions'][action_taken] = stats['actions'].get(action_taken, 0) + count
+            stats['profit_loss'] += profit_loss or 0.0
+            stats['showdown_frequency'] += showdowns or 0
         
         if stats['total_hands'] > 0:
             stats['showdown_frequency'] /= stats['total_hands']
             
         return stats
 
+    def get_data_version(self) -> tuple:
+        """Get (latest hand id, latest result id), which changes whenever new data is recorded"""
+        self.flush()
+        return tuple(self.session.query(
+            self.session.query(func.max(Hand.id)).scalar_subquery(),
+            self.session.query(func.max(Result.id)).scalar_subquery()
+        ).one())
+
+    def get_player_stats_and_hand_perf(self) -> tuple:
+        """Get player stats and hand type performance from a single query"""
+        self.flush()
+        self._backfill_hand_types()
+        groups = self.session.query(
+            Hand.position,
+            Hand.action_taken,
+            Hand.hand_type,
+            func.count(distinct(Hand.id)),
+            func.sum(Result.profit_loss),
+            func.sum(case((Result.profit_loss > 0, 1), else_=0)),
+            func.sum(case((Result.showdown_reached, 1), else_=0))
+        ).outerjoin(Result, Result.hand_id == Hand.id).group_by(
+            Hand.position, Hand.action_taken, Hand.hand_type
+        ).all()
+        
+        stats = {
+            'total_hands': 0,
+            'positions': {},
+            'actions': {},
+            'profit_loss': 0.0,
+            'showdown_frequency': 0.0
+        }
+        performance = {}
+        
+        for position, action_taken, hand_type, count, profit_loss, profitable, showdowns in groups:
+            stats['total_hands'] += count
+            stats['positions'][position] = stats['positions'].get(position, 0) + count
+            stats['actions'][action_taken] = stats['actions'].get(action_taken, 0) + count
+            stats['profit_loss'] += profit_loss or 0.0
+            stats['showdown_frequency'] += showdowns or 0
+            
+            if hand_type not in performance:
+                performance[hand_type] = {
+                    'total_hands': 0,
+                    'profitable_hands': 0,
+                    'total_profit': 0.0
+                }
+            performance[hand_type]['total_hands'] += count
+            performance[hand_type]['profitable_hands'] += profitable or 0
+            performance[hand_type]['total_profit'] += profit_loss or 0.0
+        
+        if stats['total_hands'] > 0:
+            stats['showdown_frequency'] /= stats['total_hands']
+        
+        for hand_type_stats in performance.values():
+            hand_type_stats['win_rate'] = hand_type_stats['profitable_hands'] / hand_type_stats['total_hands']
+            hand_type_stats['average_profit'] = hand_type_stats['total_profit'] / hand_type_stats['total_hands']
+        
+        return stats, performance
+
     def get_position_success_rate(self, position: str) -> dict:
         """Calculate success rate for a specific position"""
-        hands = self.session.query(Hand).filter(Hand.position == position).all()
+        self.flush()
+        hands = self.session.query(Hand).options(
+            selectinload(Hand.result), raiseload('*')
+        ).filter(Hand.position == position).all()
         
         stats = {
             'total_hands': len(hands),
@@ -191,26 +390,23 @@ class Database:
 
     def get_hand_type_performance(self) -> dict:
         """Analyze performance by hand type"""
-        hands = self.session.query(Hand).all()
+        self.flush()
+        self._backfill_hand_types()
+        groups = self.session.query(
+            Hand.hand_type,
+            func.count(distinct(Hand.id)),
+            func.sum(case((Result.profit_loss > 0, 1), else_=0)),
+            func.sum(Result.profit_loss)
+        ).outerjoin(Result, Result.hand_id == Hand.id).group_by(Hand.hand_type).all()
         
-        performance = {}
-        for hand in hands:
-            hole_cards = json.loads(hand.hole_cards)
-            # Simplified hand type classification
-            hand_type = self._classify_hand_type(hole_cards)
-            
-            if hand_type not in performance:
-                performance[hand_type] = {
-                    'total_hands': 0,
-                    'profitable_hands': 0,
-                    'total_profit': 0.0
-                }
-            
-            performance[hand_type]['total_hands'] += 1
-            if hand.result:
-                if hand.result.profit_loss > 0:
-                    performance[hand_type]['profitable_hands'] += 1
-                performance[hand_type]['total_profit'] += hand.result.profit_loss
+        performance = {
+            hand_type: {
+                'total_hands': count,
+                'profitable_hands': profitable or 0,
+                'total_profit': total_profit or 0.0
+            }
+            for hand_type, count, profitable, total_profit in groups
+        }
         
         # Calculate win rates and average profits
         for hand_type in performance:
@@ -221,6 +417,15 @@ class Database:
         
         return performance
 
+    def _backfill_hand_types(self):
+        """Classify hands recorded before the hand_type column existed"""
+        hands = self.session.query(Hand).filter(Hand.hand_type.is_(None)).all()
+        if not hands:
+            return
+        for hand in hands:
+            hand.hand_type = self._classify_hand_type(decode_cards(hand.hole_cards))
+        self.session.commit()
+
     def _classify_hand_type(self, hole_cards: list) -> str:
         """Classify hole cards into hand types"""
         if not hole_cards or len(hole_cards) != 2:
@@ -237,5 +442,6 @@ class Database:
             return f"offsuit_{rank1}{rank2}"
 
     def close(self):
-        """Close the database session"""
+        """Flush buffered rows and close the database session"""
+        self.flush()
         self.session.close()
\ No newline at end of file
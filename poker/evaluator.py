@@ -1,8 +1,29 @@
-from typing import List, Tuple, Dict
-from collections import Counter
+from typing import List, Tuple, Dict, Optional, FrozenSet
+from functools import lru_cache
 import itertools
+import math
+import random
+import numpy as np
+from utils.constants import RANKS, SUITS, RANK_TO_INT, SUIT_TO_INT
 
 class HandEvaluator:
+    __slots__ = ('ranks', 'suits', 'hand_rankings')
+
+    # Rank character -> rank value, replacing a linear str.index scan per card
+    RANK_VALUES = RANK_TO_INT
+    # Every card with its parsed (rank_value, suit), in deck order
+    DECK = tuple(
+        (f"{rank}{suit}", (rank_value, suit))
+        for rank_value, rank in enumerate(RANKS)
+        for suit in SUITS
+    )
+
+    # Rank values and suit indices of DECK, for batch evaluation
+    DECK_RANKS = np.array([parsed[0] for _, parsed in DECK], dtype=np.int64)
+    DECK_SUITS = np.array([SUIT_TO_INT[parsed[1]] for _, parsed in DECK], dtype=np.int64)
+    # Base values in hand_rankings order, for batch evaluation
+    BATCH_BASE_VALUES = np.array([0.95, 0.90, 0.85, 0.80, 0.75, 0.70, 0.65, 0.50, 0.30])
+
     def __init__(self):
         self.ranks = '23456789TJQKA'
         self.suits = 'cdhs'
@@ -14,8 +35,7 @@ class HandEvaluator:
 
     def _parse_card(self, card: str) -> Tuple[int, str]:
         """Convert card string to (rank_value, suit)"""
-        rank, suit = card[0], card[1]
-        return self.ranks.index(rank), suit
+        return self.RANK_VALUES[card[0]], card[1]
 
     def _get_hand_rank_value(self, hand_type: str) -> float:
         """Get base value for hand type"""
@@ -34,26 +54,19 @@ class HandEvaluator:
 
     def _detect_straight(self, rank_values: List[int]) -> bool:
         """Detect if the ranks form a straight"""
-        sorted_ranks = sorted(set(rank_values))
-        if len(sorted_ranks) < 5:
-            return False
-        
-        # Check for regular straight
-        for i in range(len(sorted_ranks) - 4):
-            if sorted_ranks[i+4] - sorted_ranks[i] == 4:
-                return True
-                
+        # Bitmask of present ranks; five consecutive set bits form a straight
+        mask = 0
+        for rank in rank_values:
+            mask |= 1 << rank
+        if mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4):
+            return True
+            
         # Check for Ace-low straight (A,2,3,4,5)
-        if 12 in rank_values:  # If Ace is present
-            low_straight = [0, 1, 2, 3, 12]  # 2,3,4,5,A
-            if all(r in rank_values for r in low_straight):
-                return True
-        return False
+        return mask & 0b1000000001111 == 0b1000000001111
 
     def _detect_flush(self, suits: List[str]) -> bool:
         """Detect if the suits form a flush"""
-        suit_counts = Counter(suits)
-        return max(suit_counts.values()) >= 5
+        return len(suits) >= 5 and max(map(suits.count, set(suits))) >= 5
 
     def evaluate_hand_type(self, cards: List[str]) -> Tuple[str, List[int]]:
         """Evaluate the type of poker hand"""
@@ -67,42 +80,57 @@ class HandEvaluator:
             rank_values.append(rank_val)
             suits.append(suit)
             
-        # Count frequencies of ranks
-        rank_counts = Counter(rank_values)
-        max_rank_count = max(rank_counts.values())
+        return self._evaluate_parsed(rank_values, suits)
+
+    def _evaluate_parsed(self, rank_values: List[int], suits: List[str]) -> Tuple[str, List[int]]:
+        """Evaluate the type of poker hand from already parsed ranks and suits"""
+        # Hole cards only (preflop): a pair or two high cards
+        if len(rank_values) == 2:
+            high, low = max(rank_values), min(rank_values)
+            return ('pair', [high]) if high == low else ('high_card', [high, low])
+            
+        # Fixed-size rank histogram instead of a Counter; flush/straight checked once
+        rank_counts = [0] * 13
+        for rank in rank_values:
+            rank_counts[rank] += 1
+        max_rank_count = max(rank_counts)
+        # Fewer than five cards cannot make a straight or a flush
+        has_five = len(rank_values) >= 5
+        is_flush = has_five and self._detect_flush(suits)
+        is_straight = has_five and self._detect_straight(rank_values)
         
         # Check for straight flush
-        if self._detect_flush(suits) and self._detect_straight(rank_values):
+        if is_flush and is_straight:
             return 'straight_flush', sorted(rank_values, reverse=True)
             
         # Four of a kind
         if max_rank_count == 4:
-            return 'four_kind', [r for r, c in rank_counts.items() if c == 4]
+            return 'four_kind', [r for r in range(13) if rank_counts[r] == 4]
             
         # Full house
-        if max_rank_count == 3 and len([c for c in rank_counts.values() if c >= 2]) >= 2:
-            return 'full_house', [r for r, c in rank_counts.items() if c == 3]
+        if max_rank_count == 3 and sum(c >= 2 for c in rank_counts) >= 2:
+            return 'full_house', [r for r in range(13) if rank_counts[r] == 3]
             
         # Flush
-        if self._detect_flush(suits):
+        if is_flush:
             return 'flush', sorted(rank_values, reverse=True)[:5]
             
         # Straight
-        if self._detect_straight(rank_values):
+        if is_straight:
             return 'straight', sorted(rank_values, reverse=True)[:5]
             
         # Three of a kind
         if max_rank_count == 3:
-            return 'three_kind', [r for r, c in rank_counts.items() if c == 3]
+            return 'three_kind', [r for r in range(13) if rank_counts[r] == 3]
             
         # Two pair
-        pairs = [r for r, c in rank_counts.items() if c == 2]
+        pairs = [r for r in range(12, -1, -1) if rank_counts[r] == 2]
         if len(pairs) >= 2:
-            return 'two_pair', sorted(pairs, reverse=True)[:2]
+            return 'two_pair', pairs[:2]
             
         # One pair
         if max_rank_count == 2:
-            return 'pair', [r for r, c in rank_counts.items() if c == 2]
+            return 'pair', pairs
             
         # High card
         return 'high_card', sorted(rank_values, reverse=True)[:5]
@@ -112,8 +140,20 @@ class HandEvaluator:
         if not hole_cards:
             return 0.0
             
-        total_cards = hole_cards + (community_cards if community_cards else [])
-        hand_type, key_ranks = self.evaluate_hand_type(total_cards)
+        # Card order does not affect strength, so equal card sets share a cache entry
+        return _cached_strength(frozenset(hole_cards), frozenset(community_cards or ()))
+
+    def _strength_from_cards(self, hole_cards: FrozenSet[str], community_cards: FrozenSet[str]) -> float:
+        """Hand strength for a set of hole and community cards"""
+        parsed = [self._parse_card(card) for card in hole_cards]
+        parsed += [self._parse_card(card) for card in community_cards]
+        return self._strength_from_parsed(parsed, set(rank for rank, _ in parsed[:len(hole_cards)]))
+
+    def _strength_from_parsed(self, parsed: List[Tuple[int, str]], hole_ranks: set) -> float:
+        """Calculate relative hand strength from parsed (rank_value, suit) cards"""
+        hand_type, key_ranks = self._evaluate_parsed(
+            [rank for rank, _ in parsed], [suit for _, suit in parsed]
+        )
         
         # Base strength from hand type
         strength = self._get_hand_rank_value(hand_type)
@@ -124,51 +164,113 @@ class HandEvaluator:
             strength += (1 - strength) * rank_adjustment * 0.2
         
         # Adjust for hole cards involvement
-        hole_ranks = set(card[0] for card in hole_cards)
-        key_card_ranks = set(self.ranks[r] for r in key_ranks)
-        if not key_card_ranks.intersection(hole_ranks):
+        if hole_ranks.isdisjoint(key_ranks):
             strength *= 0.7  # Significantly reduce strength if hole cards aren't involved
             
         return min(1.0, max(0.0, strength))
 
-    def calculate_hand_potential(self, hole_cards: List[str], community_cards: List[str]) -> Tuple[float, float]:
-        """Calculate positive and negative potential"""
+    def _batch_strengths(self, rank_counts: np.ndarray, suit_counts: np.ndarray,
+                         hole_mask: np.ndarray) -> np.ndarray:
+        """Vectorized hand strength for many boards given (N, 13) rank and (N, 4) suit counts"""
+        rank_values = np.arange(13)
+        n_boards = len(rank_counts)
+        max_count = rank_counts.max(axis=1)
+        present = rank_counts > 0
+        
+        flush = suit_counts.max(axis=1) >= 5
+        windows = np.stack([present[:, i:i + 5].all(axis=1) for i in range(9)], axis=1)
+        straight = windows.any(axis=1) | present[:, [0, 1, 2, 3, 12]].all(axis=1)
+        
+        # Top five ranks of the sorted card list (with duplicates), highest first
+        from_top = rank_counts[:, ::-1].cumsum(axis=1)[:, ::-1]
+        top_five = np.minimum(from_top, 5) - np.minimum(from_top - rank_counts, 5)
+        # Two highest paired ranks
+        is_pair = rank_counts == 2
+        top_pairs = is_pair & (is_pair[:, ::-1].cumsum(axis=1)[:, ::-1] <= 2)
+        
+        # Hand type index into hand_rankings, checked in evaluate_hand_type's order
+        conditions = [
+            flush & straight,
+            max_count == 4,
+            (max_count == 3) & ((rank_counts >= 2).sum(axis=1) >= 2),
+            flush,
+            straight,
+            max_count == 3,
+            is_pair.sum(axis=1) >= 2,
+            max_count == 2
+        ]
+        hand_type = np.select(conditions, np.arange(8), default=8)
+        
+        # Multiplicity of each rank among the key ranks for every hand type
+        key_weights = np.select(
+            [(hand_type == t)[:, None] for t in range(9)],
+            [rank_counts, rank_counts == 4, rank_counts == 3, top_five, top_five,
+             rank_counts == 3, top_pairs, rank_counts == 2, top_five]
+        ).astype(np.int64)
+        key_len = key_weights.sum(axis=1)
+        key_sum = key_weights @ rank_values
+        
+        strength = self.BATCH_BASE_VALUES[hand_type]
+        rank_adjustment = np.divide(key_sum / len(self.ranks), key_len,
+                                    out=np.zeros(n_boards), where=key_len > 0)
+        strength = strength + (1 - strength) * rank_adjustment * 0.2
+        
+        # Reduce strength when no hole card rank is among the key ranks
+        involved = ((key_weights > 0) & hole_mask).any(axis=1)
+        strength = np.where(involved, strength, strength * 0.7)
+        return np.clip(strength, 0.0, 1.0)
+
+    def calculate_hand_potential(self, hole_cards: List[str], community_cards: List[str],
+                                 max_samples: Optional[int] = 100) -> Tuple[float, float]:
+        """Calculate positive and negative potential (max_samples=None enumerates every runout)"""
         if len(community_cards) >= 5:
             return (0.0, 0.0)
             
-        current_strength = self.evaluate_hand_strength(hole_cards, community_cards)
-        remaining_cards = []
-        
-        # Generate remaining possible cards
-        used_cards = set(hole_cards + community_cards)
-        for rank in self.ranks:
-            for suit in self.suits:
-                card = f"{rank}{suit}"
-                if card not in used_cards:
-                    remaining_cards.append(card)
-                    
-        # Sample possible outcomes
-        better_count = worse_count = total_count = 0
-        max_samples = 100  # Limit sampling for performance
+        # Remaining possible cards, as indices into DECK
+        used_cards = set(hole_cards).union(community_cards)
+        remaining = np.array([i for i, (card, _) in enumerate(self.DECK) if card not in used_cards])
         
+        # Candidate runouts, evaluated together in one batch; random draws when
+        # max_samples is below the number of runouts, so the sample is unbiased
         possible_cards = min(5 - len(community_cards), 2)
-        for next_cards in itertools.combinations(remaining_cards, possible_cards):
-            future_community = community_cards + list(next_cards)
-            future_strength = self.evaluate_hand_strength(hole_cards, future_community)
-            
-            if future_strength > current_strength:
-                better_count += 1
-            elif future_strength < current_strength:
-                worse_count += 1
-            total_count += 1
-            
-            if total_count >= max_samples:
-                break
-                
-        if total_count == 0:
+        total_runouts = math.comb(len(remaining), possible_cards)
+        if max_samples is None or max_samples >= total_runouts:
+            runouts = itertools.combinations(range(len(remaining)), possible_cards)
+        else:
+            indices = range(len(remaining))
+            runouts = (random.sample(indices, possible_cards) for _ in range(max_samples))
+        runouts = np.array(list(runouts), dtype=np.int64).reshape(-1, possible_cards)
+        if len(runouts) == 0:
             return (0.0, 0.0)
-            
-        positive_potential = better_count / total_count
-        negative_potential = worse_count / total_count
+        runouts = remaining[runouts]
+        
+        known = [self._parse_card(card) for card in list(hole_cards) + list(community_cards)]
+        hole_mask = np.zeros(13, dtype=bool)
+        hole_mask[[rank for rank, _ in known[:len(hole_cards)]]] = True
+        
+        # Row 0 is the current board; the rest add each runout's cards
+        rank_counts = np.zeros((len(runouts) + 1, 13), dtype=np.int64)
+        suit_counts = np.zeros((len(runouts) + 1, 4), dtype=np.int64)
+        for rank, suit in known:
+            rank_counts[:, rank] += 1
+            suit_counts[:, SUIT_TO_INT[suit]] += 1
+        rows = np.arange(1, len(runouts) + 1)
+        for column in runouts.T:
+            np.add.at(rank_counts, (rows, self.DECK_RANKS[column]), 1)
+            np.add.at(suit_counts, (rows, self.DECK_SUITS[column]), 1)
+        
+        strengths = self._batch_strengths(rank_counts, suit_counts, hole_mask)
+        current_strength, future_strengths = strengths[0], strengths[1:]
+        
+        positive_potential = float((future_strengths > current_strength).mean())
+        negative_potential = float((future_strengths < current_strength).mean())
         
         return (positive_potential, negative_potential)
+
+# Evaluator backing the shared strength cache (evaluators hold no per-request state)
+_STRENGTH_EVALUATOR = HandEvaluator()
+
+@lru_cache(maxsize=4096)
+def _cached_strength(hole_cards: FrozenSet[str], community_cards: FrozenSet[str]) -> float:
+    """Memoized hand strength for a canonical set of hole and community cards, shared by all evaluators"""
+    return _STRENGTH_EVALUATOR._strength_from_cards(hole_cards, community_cards)
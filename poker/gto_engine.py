@@ -1,48 +1,139 @@
-from typing import List, Dict, Tuple
-import random
-from utils.constants import PREMIUM_HANDS, STRONG_HANDS, PLAYABLE_HANDS
+from typing import List, Dict, Tuple, Sequence, Optional, NamedTuple
+from types import MappingProxyType
+import numpy as np
+from utils.constants import Position, RANKS, RANK_TO_INT, PREMIUM_HANDS, STRONG_HANDS, PLAYABLE_HANDS
+
+# Row/column order of the flat position lookup tables
+GTO_POSITIONS = tuple(position.name for position in Position)
+POSITION_INDEX = {position.name: position.value for position in Position}
+
+# Post-flop bet sizing band (fraction of pot) per street
+POSTFLOP_SIZES = {
+    "Flop": (0.5, 0.75),
+    "Turn": (0.66, 0.85),
+    "River": (0.75, 1.0)
+}
+
+class ActionFrequencies(NamedTuple):
+    """Normalized action frequencies, in ACTION_FREQUENCY_TABLE column order"""
+    raise_: float
+    call: float
+    fold: float
+
+# Raise/call/fold frequency shifts for strong (> 0.8), good (> 0.6) and weak (< 0.3) hands
+STRENGTH_ADJUSTMENTS = np.array([
+    [0.2, -0.1, -0.1],
+    [0.1, 0.1, -0.2],
+    [-0.2, -0.1, 0.3]
+])
+
+HAND_RANKS = ''.join(RANKS)
+RANK_INDEX = RANK_TO_INT
+
+def _base_range_strength(rank1: str, rank2: str, suited: bool) -> float:
+    """Preflop chart strength of two hole card ranks, before position adjustments"""
+    if rank1 == rank2:
+        pair_rank = RANK_INDEX[rank1]
+        if pair_rank >= 10:  # TT+
+            return 1.0
+        elif pair_rank >= 7:  # 77-99
+            return 0.8
+        elif pair_rank >= 4:  # 44-66
+            return 0.6
+        return 0.4  # 22-33
+    
+    hand_str = ''.join(sorted([rank1, rank2]))
+    hand_str = hand_str + 's' if suited else hand_str
+    if hand_str in PREMIUM_HANDS:
+        return 1.0
+    elif hand_str in STRONG_HANDS:
+        return 0.8
+    elif hand_str in PLAYABLE_HANDS:
+        return 0.6
+    return 0.3
+
+# Base strength of every (rank1, rank2, suited) combination,
+# indexed by (rank1 * 13 + rank2) * 2 + suited
+RANGE_TIERS = tuple(
+    _base_range_strength(rank1, rank2, suited)
+    for rank1 in HAND_RANKS for rank2 in HAND_RANKS for suited in (False, True)
+)
+
+def _frozen(table: dict) -> MappingProxyType:
+    """Read-only view of a table of per-position dicts, safe to share between engines"""
+    return MappingProxyType({key: MappingProxyType(value) for key, value in table.items()})
+
+# Enhanced position ranges with more conservative EP ranges
+POSITION_RANGES = _frozen({
+    'EP': {'range': 0.08, 'rfi': 0.06, '3bet': 0.04, '4bet': 0.02},  # More conservative
+    'MP': {'range': 0.15, 'rfi': 0.12, '3bet': 0.07, '4bet': 0.04},
+    'CO': {'range': 0.25, 'rfi': 0.22, '3bet': 0.12, '4bet': 0.06},
+    'BTN': {'range': 0.35, 'rfi': 0.32, '3bet': 0.15, '4bet': 0.08},
+    'SB': {'range': 0.20, 'rfi': 0.18, '3bet': 0.13, '4bet': 0.07},
+    'BB': {'range': 0.30, 'rfi': 0.25, '3bet': 0.14, '4bet': 0.06}
+})
+
+# Position vs Position adjustments
+PVP_ADJUSTMENTS = _frozen({
+    'BTN': {'BB': 1.2, 'SB': 1.15, 'CO': 0.9, 'MP': 0.85, 'EP': 0.8},
+    'CO': {'BTN': 1.1, 'BB': 1.15, 'SB': 1.1, 'MP': 0.9, 'EP': 0.85},
+    'MP': {'BTN': 1.05, 'CO': 1.05, 'BB': 1.1, 'SB': 1.05, 'EP': 0.9},
+    'EP': {'BTN': 0.9, 'CO': 0.9, 'MP': 0.9, 'BB': 0.95, 'SB': 0.9},  # More conservative
+    'SB': {'BTN': 0.9, 'CO': 0.9, 'MP': 0.85, 'EP': 0.85, 'BB': 0.9},
+    'BB': {'BTN': 1.1, 'CO': 1.05, 'MP': 1.0, 'EP': 0.95, 'SB': 1.15}
+})
+
+# Adjusted action frequencies for more folding in EP
+ACTION_FREQUENCIES = _frozen({
+    'EP': {'raise': 0.5, 'call': 0.2, 'fold': 0.3},  # Increased fold frequency
+    'MP': {'raise': 0.65, 'call': 0.25, 'fold': 0.1},
+    'CO': {'raise': 0.60, 'call': 0.30, 'fold': 0.1},
+    'BTN': {'raise': 0.55, 'call': 0.35, 'fold': 0.1},
+    'SB': {'raise': 0.45, 'call': 0.35, 'fold': 0.2},
+    'BB': {'raise': 0.40, 'call': 0.45, 'fold': 0.15}
+})
+
+# Position-based bet sizing adjustments
+POSITION_SIZING = _frozen({
+    'EP': {'pfr': 2.75, 'cbet': 0.6, '3bet': 3.0},  # Larger raises from EP
+    'MP': {'pfr': 2.5, 'cbet': 0.65, '3bet': 3.0},
+    'CO': {'pfr': 2.25, 'cbet': 0.7, '3bet': 2.75},
+    'BTN': {'pfr': 2.25, 'cbet': 0.75, '3bet': 2.5},
+    'SB': {'pfr': 3.0, 'cbet': 0.65, '3bet': 3.5},
+    'BB': {'pfr': 3.0, 'cbet': 0.6, '3bet': 3.25}
+})
+
+# Flat copies of the lookup tables, indexed by POSITION_INDEX
+RANGE_MULTIPLIERS = np.array([POSITION_RANGES[p]['range'] for p in GTO_POSITIONS])
+RFI_FREQUENCIES = np.array([POSITION_RANGES[p]['rfi'] for p in GTO_POSITIONS])
+SIZING_TABLE = np.array([
+    [POSITION_SIZING[p]['pfr'], POSITION_SIZING[p]['cbet']]
+    for p in GTO_POSITIONS
+])
+ACTION_FREQUENCY_TABLE = np.array([
+    [ACTION_FREQUENCIES[p][action] for action in ('raise', 'call', 'fold')]
+    for p in GTO_POSITIONS
+])
+PVP_TABLE = np.array([
+    [PVP_ADJUSTMENTS[p].get(vs, 1.0) for vs in GTO_POSITIONS]
+    for p in GTO_POSITIONS
+])
+for _table in (RANGE_MULTIPLIERS, RFI_FREQUENCIES, SIZING_TABLE, ACTION_FREQUENCY_TABLE, PVP_TABLE):
+    _table.setflags(write=False)
 
 class GTOEngine:
-    def __init__(self):
-        # Enhanced position ranges with more conservative EP ranges
-        self.position_ranges = {
-            'EP': {'range': 0.08, 'rfi': 0.06, '3bet': 0.04, '4bet': 0.02},  # More conservative
-            'MP': {'range': 0.15, 'rfi': 0.12, '3bet': 0.07, '4bet': 0.04},
-            'CO': {'range': 0.25, 'rfi': 0.22, '3bet': 0.12, '4bet': 0.06},
-            'BTN': {'range': 0.35, 'rfi': 0.32, '3bet': 0.15, '4bet': 0.08},
-            'SB': {'range': 0.20, 'rfi': 0.18, '3bet': 0.13, '4bet': 0.07},
-            'BB': {'range': 0.30, 'rfi': 0.25, '3bet': 0.14, '4bet': 0.06}
-        }
-        
-        # Position vs Position adjustments
-        self.pvp_adjustments = {
-            'BTN': {'BB': 1.2, 'SB': 1.15, 'CO': 0.9, 'MP': 0.85, 'EP': 0.8},
-            'CO': {'BTN': 1.1, 'BB': 1.15, 'SB': 1.1, 'MP': 0.9, 'EP': 0.85},
-            'MP': {'BTN': 1.05, 'CO': 1.05, 'BB': 1.1, 'SB': 1.05, 'EP': 0.9},
-            'EP': {'BTN': 0.9, 'CO': 0.9, 'MP': 0.9, 'BB': 0.95, 'SB': 0.9},  # More conservative
-            'SB': {'BTN': 0.9, 'CO': 0.9, 'MP': 0.85, 'EP': 0.85, 'BB': 0.9},
-            'BB': {'BTN': 1.1, 'CO': 1.05, 'MP': 1.0, 'EP': 0.95, 'SB': 1.15}
-        }
-        
-        # Adjusted action frequencies for more folding in EP
-        self.action_frequencies = {
-            'EP': {'raise': 0.5, 'call': 0.2, 'fold': 0.3},  # Increased fold frequency
-            'MP': {'raise': 0.65, 'call': 0.25, 'fold': 0.1},
-            'CO': {'raise': 0.60, 'call': 0.30, 'fold': 0.1},
-            'BTN': {'raise': 0.55, 'call': 0.35, 'fold': 0.1},
-            'SB': {'raise': 0.45, 'call': 0.35, 'fold': 0.2},
-            'BB': {'raise': 0.40, 'call': 0.45, 'fold': 0.15}
-        }
-        
-        # Position-based bet sizing adjustments
-        self.position_sizing = {
-            'EP': {'pfr': 2.75, 'cbet': 0.6, '3bet': 3.0},  # Larger raises from EP
-            'MP': {'pfr': 2.5, 'cbet': 0.65, '3bet': 3.0},
-            'CO': {'pfr': 2.25, 'cbet': 0.7, '3bet': 2.75},
-            'BTN': {'pfr': 2.25, 'cbet': 0.75, '3bet': 2.5},
-            'SB': {'pfr': 3.0, 'cbet': 0.65, '3bet': 3.5},
-            'BB': {'pfr': 3.0, 'cbet': 0.6, '3bet': 3.25}
-        }
+    __slots__ = ()
+
+    # Stateless: every table is shared module-level data, so instances are free to create
+    position_ranges = POSITION_RANGES
+    pvp_adjustments = PVP_ADJUSTMENTS
+    action_frequencies = ACTION_FREQUENCIES
+    position_sizing = POSITION_SIZING
+    _range_mult = RANGE_MULTIPLIERS
+    _rfi = RFI_FREQUENCIES
+    _sizing = SIZING_TABLE
+    _action_freqs = ACTION_FREQUENCY_TABLE
+    _pvp = PVP_TABLE
 
     def is_pocket_pair(self, hand: List[str]) -> Tuple[bool, int]:
         """Check if hand is a pocket pair and return rank"""
@@ -54,10 +145,17 @@ class GTOEngine:
             return True, ranks.index(rank1)
         return False, 0
 
+    def _pvp_multiplier(self, position: str, vs_position: str) -> float:
+        """Position vs position adjustment, 1.0 for an unknown opponent position"""
+        vs_index = POSITION_INDEX.get(vs_position)
+        if vs_index is None:
+            return 1.0
+        return float(self._pvp[POSITION_INDEX[position], vs_index])
+
     def calculate_hand_equity(self, hand_strength: float, position: str, vs_position: str = None, 
                             hand: List[str] = None, stack_to_pot: float = None) -> float:
         """Calculate hand equity with additional pocket pair and stack considerations"""
-        position_multiplier = self.position_ranges[position]['range']
+        position_multiplier = float(self._range_mult[POSITION_INDEX[position]])
         
         # Adjust for pocket pairs
         if hand:
@@ -74,42 +172,42 @@ class GTOEngine:
                         position_multiplier *= 0.8
         
         if vs_position and vs_position != position:
-            pvp_mult = self.pvp_adjustments[position].get(vs_position, 1.0)
+            pvp_mult = self._pvp_multiplier(position, vs_position)
             position_multiplier *= pvp_mult
             
         return min(1.0, hand_strength * (1 + position_multiplier))
 
+    def _preflop_sizing(self, position_index: int, stack: float, stack_to_pot: float) -> float:
+        """Pre-flop open size for a position (deterministic, no table lookups by name)"""
+        pfr_size = float(self._sizing[position_index, 0])
+        if stack_to_pot < 15:  # Shallow stack adjustments
+            return min(pfr_size * 0.8, stack * 0.1)
+        return min(pfr_size, stack * 0.1)
+
     def get_optimal_sizing(self, street: str, pot_size: float, stack: float, position: str) -> float:
         """Calculate GTO-based bet sizing with position consideration"""
-        pos_sizes = self.position_sizing[position]
+        position_index = POSITION_INDEX[position]
         stack_to_pot = stack / pot_size if pot_size > 0 else float('inf')
         
         if street == "Pre-flop":
-            if stack_to_pot < 15:  # Shallow stack adjustments
-                return min(pos_sizes['pfr'] * 0.8, stack * 0.1)
-            return min(pos_sizes['pfr'], stack * 0.1)
-        
-        base_sizes = {
-            "Flop": (0.5, 0.75),
-            "Turn": (0.66, 0.85),
-            "River": (0.75, 1.0)
-        }
+            return self._preflop_sizing(position_index, stack, stack_to_pot)
         
-        min_size, max_size = base_sizes.get(street, (0.5, 0.75))
-        position_adjustment = pos_sizes['cbet'] / 0.65
+        min_size, max_size = POSTFLOP_SIZES.get(street, (0.5, 0.75))
+        position_adjustment = float(self._sizing[position_index, 1]) / 0.65
         
         # Adjust sizing based on stack depth
         if stack_to_pot < 10:
             position_adjustment *= 0.8  # Smaller bets with shallow stacks
         
-        optimal_size = random.uniform(min_size, max_size) * pot_size * position_adjustment
+        # Middle of the street's sizing band, so sizing is reproducible
+        optimal_size = (min_size + max_size) / 2 * pot_size * position_adjustment
         return min(optimal_size, stack)
 
     def get_gto_action_distribution(self, position: str, hand_strength: float, 
                                   vs_position: str = None, hand: List[str] = None,
-                                  stack_to_pot: float = None) -> Dict[str, float]:
+                                  stack_to_pot: float = None) -> ActionFrequencies:
         """Get GTO-based action distribution with enhanced pocket pair handling"""
-        base_frequencies = self.action_frequencies[position].copy()
+        raise_freq, call_freq, fold_freq = self._action_freqs[POSITION_INDEX[position]].tolist()
         
         # Special handling for pocket pairs
         if hand:
@@ -117,80 +215,68 @@ class GTOEngine:
             if is_pair:
                 if position == 'EP' and pair_rank < 7:
                     # Significantly reduce raising frequency for small pairs in EP
-                    base_frequencies['raise'] *= 0.5
-                    base_frequencies['fold'] += base_frequencies['raise'] * 0.5
+                    raise_freq *= 0.5
+                    fold_freq += raise_freq * 0.5
                     
                 if stack_to_pot:
                     if stack_to_pot > 20 and pair_rank < 9:
                         # Increase calling frequency with deep stacks
-                        base_frequencies['call'] *= 1.3
-                        base_frequencies['fold'] *= 0.7
+                        call_freq *= 1.3
+                        fold_freq *= 0.7
                     elif stack_to_pot < 10:
                         # Increase folding frequency with shallow stacks
-                        base_frequencies['fold'] *= 1.3
-                        base_frequencies['call'] *= 0.7
+                        fold_freq *= 1.3
+                        call_freq *= 0.7
         
-        if vs_position:
-            pvp_mult = self.pvp_adjustments[position].get(vs_position, 1.0)
+        # Playing against your own position (or no opponent) has no matchup adjustment
+        pvp_mult = None
+        if vs_position and vs_position != position:
+            pvp_mult = self._pvp_multiplier(position, vs_position)
+        return self._finish_distribution(raise_freq, call_freq, fold_freq, hand_strength, pvp_mult)
+
+    def _finish_distribution(self, raise_freq: float, call_freq: float, fold_freq: float,
+                             hand_strength: float, pvp_mult: Optional[float]) -> ActionFrequencies:
+        """Apply the matchup and hand strength adjustments, then normalize"""
+        if pvp_mult is not None:
             if pvp_mult > 1:
-                base_frequencies['raise'] *= pvp_mult
-                base_frequencies['fold'] /= pvp_mult
+                raise_freq *= pvp_mult
+                fold_freq /= pvp_mult
             else:
-                base_frequencies['raise'] /= (2 - pvp_mult)
-                base_frequencies['fold'] *= (2 - pvp_mult)
+                raise_freq /= (2 - pvp_mult)
+                fold_freq *= (2 - pvp_mult)
         
         # Adjust frequencies based on hand strength
         if hand_strength > 0.8:
-            base_frequencies['raise'] += 0.2
-            base_frequencies['call'] -= 0.1
-            base_frequencies['fold'] -= 0.1
+            raise_freq += 0.2
+            call_freq -= 0.1
+            fold_freq -= 0.1
         elif hand_strength > 0.6:
-            base_frequencies['raise'] += 0.1
-            base_frequencies['call'] += 0.1
-            base_frequencies['fold'] -= 0.2
+            raise_freq += 0.1
+            call_freq += 0.1
+            fold_freq -= 0.2
         elif hand_strength < 0.3:
-            base_frequencies['raise'] -= 0.2
-            base_frequencies['call'] -= 0.1
-            base_frequencies['fold'] += 0.3
+            raise_freq -= 0.2
+            call_freq -= 0.1
+            fold_freq += 0.3
             
         # Normalize frequencies
-        total = sum(base_frequencies.values())
-        return {k: v/total for k, v in base_frequencies.items()}
+        total = raise_freq + call_freq + fold_freq
+        return ActionFrequencies(raise_freq / total, call_freq / total, fold_freq / total)
 
     def get_range_strength(self, hand: List[str], position: str) -> float:
         """Calculate range strength with enhanced pocket pair considerations"""
-        hand_str = ''.join(sorted([card[0] for card in hand]))
-        suited = hand[0][1] == hand[1][1]
-        hand_str = hand_str + 's' if suited else hand_str
+        # Chart tier from a precomputed table instead of building and matching hand strings
+        rank1, rank2 = hand[0][0], hand[1][0]
+        strength = RANGE_TIERS[(RANK_INDEX[rank1] * 13 + RANK_INDEX[rank2]) * 2 + (hand[0][1] == hand[1][1])]
         
-        # Special handling for pocket pairs
-        is_pair, pair_rank = self.is_pocket_pair(hand)
-        if is_pair:
-            if pair_rank >= 10:  # TT+
-                strength = 1.0
-            elif pair_rank >= 7:  # 77-99
-                strength = 0.8
-            elif pair_rank >= 4:  # 44-66
-                strength = 0.6
-            else:  # 22-33
-                strength = 0.4
-                
-            # Additional position-based adjustments for pairs
+        # Additional position-based adjustments for pairs
+        if rank1 == rank2:
             if position == 'EP':
                 strength *= 0.8  # More conservative in EP
             elif position in ['BTN', 'CO']:
                 strength *= 1.1  # More playable in late position
-        else:
-            if hand_str in PREMIUM_HANDS:
-                strength = 1.0
-            elif hand_str in STRONG_HANDS:
-                strength = 0.8
-            elif hand_str in PLAYABLE_HANDS:
-                strength = 0.6
-            else:
-                strength = 0.3
             
-        position_rfi = self.position_ranges[position]['rfi']
+        position_rfi = float(self._rfi[POSITION_INDEX[position]])
         return min(1.0, strength * (1 + position_rfi))
 
     def calculate_gto_ev(self, hand_strength: float, pot_size: float, to_call: float,
@@ -202,24 +288,38 @@ class GTOEngine:
             hand_strength, position, vs_position, hand, stack_to_pot
         )
         
-        fold_ev = 0
-        call_ev = (position_equity * pot_size) - ((1 - position_equity) * to_call)
-        
-        # Adjust EV calculations for pocket pairs
+        # Reduce call EV for small pairs in EP
+        call_scale = 1.0
         if hand:
             is_pair, pair_rank = self.is_pocket_pair(hand)
             if is_pair and pair_rank < 7 and position == 'EP':
-                call_ev *= 0.8  # Reduce EV for small pairs in EP
+                call_scale = 0.8
         
-        raise_size = self.get_optimal_sizing("Pre-flop", pot_size, stack, position)
+        # Playing against your own position (or no opponent) has no matchup adjustment
+        pvp_mult = None
+        if vs_position and vs_position != position:
+            pvp_mult = self._pvp_multiplier(position, vs_position)
+        
+        return self._evs_from_equity(position_equity, pot_size, to_call, POSITION_INDEX[position],
+                                     stack, stack_to_pot, pvp_mult, call_scale)
+
+    def _evs_from_equity(self, position_equity: float, pot_size: float, to_call: float,
+                         position_index: int, stack: float, stack_to_pot: float,
+                         pvp_mult: Optional[float], call_scale: float = 1.0) -> Dict[str, float]:
+        """FOLD/CALL/RAISE EVs for an already adjusted equity"""
+        fold_ev = 0
+        call_ev = (position_equity * pot_size) - ((1 - position_equity) * to_call)
+        if call_scale != 1.0:
+            call_ev *= call_scale
+        
+        raise_size = self._preflop_sizing(position_index, stack, stack_to_pot)
         raise_ev = (position_equity * (pot_size + raise_size)) - ((1 - position_equity) * raise_size)
         
         # Stack depth considerations
         if stack_to_pot < 15:
             raise_ev *= 0.9  # Reduce raising EV with shallow stacks
         
-        if vs_position:
-            pvp_mult = self.pvp_adjustments[position].get(vs_position, 1.0)
+        if pvp_mult is not None:
             call_ev *= pvp_mult
             raise_ev *= pvp_mult
         
@@ -228,3 +328,85 @@ class GTOEngine:
             'CALL': call_ev,
             'RAISE': raise_ev
         }
+
+    def evaluate(self, hand_strength: float, pot_size: float, to_call: float, position: str,
+                 stack: float, vs_position: str = None) -> Tuple[Dict[str, float], ActionFrequencies, float]:
+        """EVs, action frequencies and equity for one spot, resolving the position tables once"""
+        position_index = POSITION_INDEX[position]
+        pvp_mult = None
+        if vs_position and vs_position != position:
+            pvp_mult = self._pvp_multiplier(position, vs_position)
+        
+        position_multiplier = float(self._range_mult[position_index])
+        if pvp_mult is not None:
+            position_multiplier *= pvp_mult
+        equity = min(1.0, hand_strength * (1 + position_multiplier))
+        
+        stack_to_pot = stack / pot_size if pot_size > 0 else float('inf')
+        evs = self._evs_from_equity(equity, pot_size, to_call, position_index, stack, stack_to_pot, pvp_mult)
+        raise_freq, call_freq, fold_freq = self._action_freqs[position_index].tolist()
+        frequencies = self._finish_distribution(raise_freq, call_freq, fold_freq, hand_strength, pvp_mult)
+        return evs, frequencies, equity
+
+    def position_indices(self, positions: Sequence[str]) -> np.ndarray:
+        """Map hero position names to POSITION_INDEX values (KeyError for unknown, as in evaluate)"""
+        return np.array([POSITION_INDEX[p] for p in positions], dtype=np.int64)
+
+    def vs_position_indices(self, vs_positions: Sequence[Optional[str]]) -> np.ndarray:
+        """Map opponent position names to POSITION_INDEX values (-1 for None or unknown)"""
+        return np.array([POSITION_INDEX.get(p, -1) for p in vs_positions], dtype=np.int64)
+
+    def _check_position_index(self, position_index: np.ndarray):
+        """Reject hero indices outside the position tables (negative ones would silently wrap)"""
+        if position_index.size and (position_index.min() < 0 or position_index.max() >= len(GTO_POSITIONS)):
+            raise ValueError(f"Invalid hero position index in {position_index.tolist()}")
+
+    def _pvp_multipliers(self, position_index: np.ndarray, vs_index: np.ndarray) -> np.ndarray:
+        """Position vs position adjustments for index arrays, 1.0 where vs_index is -1"""
+        return np.where(vs_index >= 0, self._pvp[position_index, vs_index], 1.0)
+
+    def calculate_hand_equity_batch(self, hand_strength: np.ndarray, position_index: np.ndarray,
+                                    vs_index: np.ndarray) -> np.ndarray:
+        """calculate_hand_equity over arrays of spots (no hole card adjustments)"""
+        self._check_position_index(position_index)
+        position_multiplier = self._range_mult[position_index] * self._pvp_multipliers(position_index, vs_index)
+        return np.minimum(1.0, hand_strength * (1 + position_multiplier))
+
+    def get_gto_action_distribution_batch(self, position_index: np.ndarray, hand_strength: np.ndarray,
+                                          vs_index: np.ndarray) -> np.ndarray:
+        """get_gto_action_distribution over arrays of spots, as (N, 3) raise/call/fold rows"""
+        self._check_position_index(position_index)
+        freqs = self._action_freqs[position_index]
+        pvp_mult = self._pvp_multipliers(position_index, vs_index)
+        raise_scale = np.where(pvp_mult > 1, pvp_mult, 1 / (2 - pvp_mult))
+        freqs[:, 0] *= raise_scale
+        freqs[:, 2] /= raise_scale
+        
+        # Adjust frequencies based on hand strength
+        adjustments = np.select(
+            [(hand_strength > 0.8)[:, None], (hand_strength > 0.6)[:, None], (hand_strength < 0.3)[:, None]],
+            [STRENGTH_ADJUSTMENTS[0], STRENGTH_ADJUSTMENTS[1], STRENGTH_ADJUSTMENTS[2]]
+        )
+        freqs += adjustments
+        return freqs / freqs.sum(axis=1, keepdims=True)
+
+    def calculate_gto_ev_batch(self, hand_strength: np.ndarray, pot_size: np.ndarray, to_call: np.ndarray,
+                               position_index: np.ndarray, stack: np.ndarray,
+                               vs_index: np.ndarray) -> np.ndarray:
+        """calculate_gto_ev over arrays of spots, as (N, 3) FOLD/CALL/RAISE rows"""
+        self._check_position_index(position_index)
+        stack_to_pot = np.divide(stack, pot_size, out=np.full(len(stack), np.inf), where=pot_size > 0)
+        shallow = stack_to_pot < 15
+        equity = self.calculate_hand_equity_batch(hand_strength, position_index, vs_index)
+        pvp_mult = self._pvp_multipliers(position_index, vs_index)
+        
+        evs = np.zeros((len(hand_strength), 3))
+        evs[:, 1] = (equity * pot_size) - ((1 - equity) * to_call)
+        
+        pfr_size = self._sizing[position_index, 0]
+        raise_size = np.minimum(np.where(shallow, pfr_size * 0.8, pfr_size), stack * 0.1)
+        evs[:, 2] = (equity * (pot_size + raise_size)) - ((1 - equity) * raise_size)
+        evs[:, 2] *= np.where(shallow, 0.9, 1.0)
+        
+        evs[:, 1:] *= pvp_mult[:, None]
+        return evs
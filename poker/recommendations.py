@@ -1,10 +1,20 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+import numpy as np
 from .evaluator import HandEvaluator
 from .calculator import PokerCalculator
-from .gto_engine import GTOEngine
+from .gto_engine import GTOEngine, ActionFrequencies
 from .tournament_engine import TournamentEngine
 
+# Actions in calculate_gto_ev order (also the EV columns of calculate_gto_ev_batch)
+ACTIONS = ('FOLD', 'CALL', 'RAISE')
+EV_ACTIONS = np.array(ACTIONS)
+# Position of each EV action in the raise/call/fold action frequencies
+EV_TO_FREQUENCY = (2, 1, 0)
+
 class RecommendationEngine:
+    __slots__ = ('evaluator', 'calculator', 'gto_engine', 'tournament_engine')
+
     def __init__(self):
         self.evaluator = HandEvaluator()
         self.calculator = PokerCalculator()
@@ -20,8 +30,39 @@ class RecommendationEngine:
         to_call: float,
         stack_size: float,
         vs_position: str = None,
-        tournament_info: Optional[Dict] = None
+        tournament_info: Optional[Dict] = None,
+        verbose: bool = True
+    ) -> Dict:
+        """Recommend an action; verbose=False skips building the reasoning text"""
+        # Card order does not affect the result, so equivalent spots share a cache entry
+        recommendation = _cached_recommendation(
+            tuple(sorted(hole_cards)),
+            tuple(sorted(community_cards)),
+            position,
+            pot_size,
+            to_call,
+            stack_size,
+            vs_position,
+            tuple(sorted(tournament_info.items())) if tournament_info else None,
+            verbose
+        )
+        return dict(recommendation)
+
+    def _recommend(
+        self,
+        hole_cards: Tuple[str, ...],
+        community_cards: Tuple[str, ...],
+        position: str,
+        pot_size: float,
+        to_call: float,
+        stack_size: float,
+        vs_position: Optional[str],
+        tournament_items: Optional[Tuple],
+        verbose: bool
     ) -> Dict:
+        """Recommendation for a canonical spot (see _cached_recommendation)"""
+        tournament_info = dict(tournament_items) if tournament_items else None
+
         # Calculate base hand strength and GTO-adjusted equity
         hand_strength = self.evaluator.evaluate_hand_strength(hole_cards, community_cards)
         range_strength = self.gto_engine.get_range_strength(hole_cards, position)
@@ -40,30 +81,34 @@ class RecommendationEngine:
                 tournament_info.get('in_money_spots', 0)
             )
 
-        # Calculate pot odds and position-adjusted equity
-        pot_odds = self.calculator.calculate_pot_odds(to_call, pot_size)
-        equity = self.gto_engine.calculate_hand_equity(adjusted_strength, position, vs_position)
-
-        # Get GTO-based action frequencies with position considerations
-        action_distribution = self.gto_engine.get_gto_action_distribution(
-            position, adjusted_strength, vs_position
-        )
-
-        # Calculate EVs for each action with enhanced position logic
-        evs = self.gto_engine.calculate_gto_ev(
+        # EVs, GTO action frequencies and position-adjusted equity in one pass
+        evs, action_distribution, equity = self.gto_engine.evaluate(
             adjusted_strength, pot_size, to_call, position, stack_size, vs_position
         )
 
-        # Determine optimal action based on GTO principles
-        optimal_action = max(evs.items(), key=lambda x: x[1])[0]
+        # Determine optimal action based on GTO principles (first action wins ties)
+        fold_ev, call_ev, raise_ev = evs['FOLD'], evs['CALL'], evs['RAISE']
+        if fold_ev >= call_ev and fold_ev >= raise_ev:
+            action_index, max_ev = 0, fold_ev
+        elif call_ev >= raise_ev:
+            action_index, max_ev = 1, call_ev
+        else:
+            action_index, max_ev = 2, raise_ev
+        optimal_action = ACTIONS[action_index]
 
         # Calculate confidence based on EV difference and action frequencies
-        max_ev = max(evs.values())
-        ev_range = max_ev - min(evs.values()) if max_ev > 0 else 1
-        confidence = min(1.0, (max_ev / ev_range) * action_distribution[optimal_action.lower()])
+        ev_range = max_ev - min(fold_ev, call_ev, raise_ev) if max_ev > 0 else 1
+        confidence = min(1.0, (max_ev / ev_range) * action_distribution[EV_TO_FREQUENCY[action_index]])
+
+        if not verbose:
+            return {'action': optimal_action, 'confidence': confidence, 'reasoning': ''}
+
+        # Pot odds and tournament advice only feed the reasoning text
+        pot_odds = self.calculator.calculate_pot_odds(to_call, pot_size)
 
         # Get tournament-specific advice if applicable
         tournament_advice = ""
+        m_ratio = None
         if tournament_info and tournament_adjustments:
             stage = self.tournament_engine.get_tournament_stage(
                 tournament_info['players_left'],
@@ -93,10 +138,59 @@ class RecommendationEngine:
                 vs_position,
                 tournament_info,
                 tournament_adjustments,
-                tournament_advice
+                tournament_advice,
+                m_ratio
             )
         }
 
+    def get_recommendations_batch(
+        self,
+        hole_cards: Sequence[List[str]],
+        community_cards: Sequence[List[str]],
+        positions: Sequence[str],
+        pot_sizes: Sequence[float],
+        to_calls: Sequence[float],
+        stack_sizes: Sequence[float],
+        vs_positions: Optional[Sequence[Optional[str]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Recommended action and confidence for many spots at once (no tournament adjustments or reasoning)"""
+        # Hand evaluation stays per spot; everything after it runs on arrays
+        hand_strength = np.array([
+            self.evaluator.evaluate_hand_strength(hole, community)
+            for hole, community in zip(hole_cards, community_cards)
+        ])
+        range_strength = np.array([
+            self.gto_engine.get_range_strength(hole, position)
+            for hole, position in zip(hole_cards, positions)
+        ])
+        adjusted_strength = (hand_strength + range_strength) / 2
+        
+        position_index = self.gto_engine.position_indices(positions)
+        vs_index = self.gto_engine.vs_position_indices(vs_positions or [None] * len(positions))
+        pot_sizes = np.asarray(pot_sizes, dtype=float)
+        
+        action_distribution = self.gto_engine.get_gto_action_distribution_batch(
+            position_index, adjusted_strength, vs_index
+        )
+        evs = self.gto_engine.calculate_gto_ev_batch(
+            adjusted_strength, pot_sizes, np.asarray(to_calls, dtype=float),
+            position_index, np.asarray(stack_sizes, dtype=float), vs_index
+        )
+        
+        optimal = evs.argmax(axis=1)
+        rows = np.arange(len(optimal))
+        max_ev = evs[rows, optimal]
+        ev_range = np.where(max_ev > 0, max_ev - evs.min(axis=1), 1.0)
+        frequency = action_distribution[rows, np.array(EV_TO_FREQUENCY)[optimal]]
+        confidence = np.minimum(1.0, (max_ev / ev_range) * frequency)
+        
+        return {
+            'action': EV_ACTIONS[optimal],
+            'confidence': confidence,
+            'evs': evs,
+            'hand_strength': hand_strength
+        }
+
     def _generate_reasoning(
         self,
         action: str,
@@ -104,20 +198,22 @@ class RecommendationEngine:
         pot_odds: float,
         ev: float,
         position: str,
-        action_freq: Dict[str, float],
+        action_freq: ActionFrequencies,
         range_strength: float,
         vs_position: str = None,
         tournament_info: Optional[Dict] = None,
         tournament_adjustments: Optional[Dict] = None,
-        tournament_advice: str = ""
+        tournament_advice: str = "",
+        m_ratio: Optional[float] = None
     ) -> str:
         position_context = f"vs {vs_position}" if vs_position else "in general"
+        position_range = self.gto_engine.position_ranges[position]
         
         position_analysis = f"""
         Position Analysis ({position} {position_context}):
-        - Position Range: {self.gto_engine.position_ranges[position]['range']:.2%}
-        - RFI Frequency: {self.gto_engine.position_ranges[position]['rfi']:.2%}
-        - 3-Bet Range: {self.gto_engine.position_ranges[position]['3bet']:.2%}
+        - Position Range: {position_range['range']:.2%}
+        - RFI Frequency: {position_range['rfi']:.2%}
+        - 3-Bet Range: {position_range['3bet']:.2%}
         """
         
         if vs_position:
@@ -126,10 +222,6 @@ class RecommendationEngine:
 
         tournament_section = ""
         if tournament_info and tournament_adjustments:
-            m_ratio = self.tournament_engine.calculate_m_ratio(
-                tournament_info.get('stack_size', 0),
-                tournament_info.get('total_blinds', 1)
-            )
             tournament_section = f"""
             Tournament Considerations:
             - M-Ratio: {m_ratio:.1f}
@@ -151,12 +243,35 @@ class RecommendationEngine:
         {position_analysis}
         
         Recommended frequencies in this spot:
-        - Raise: {action_freq['raise']:.1%}
-        - Call: {action_freq['call']:.1%}
-        - Fold: {action_freq['fold']:.1%}
+        - Raise: {action_freq.raise_:.1%}
+        - Call: {action_freq.call:.1%}
+        - Fold: {action_freq.fold:.1%}
         
         {tournament_section}
         
         The {action} recommendation is optimal according to GTO principles, considering your position, 
         hand strength relative to your range, and the mathematical expectation of each action.
         """
+
+@lru_cache(maxsize=1)
+def get_recommendation_engine() -> RecommendationEngine:
+    """Get the process-wide recommendation engine (its components hold no per-request state)"""
+    return RecommendationEngine()
+
+@lru_cache(maxsize=4096)
+def _cached_recommendation(
+    hole_cards: Tuple[str, ...],
+    community_cards: Tuple[str, ...],
+    position: str,
+    pot_size: float,
+    to_call: float,
+    stack_size: float,
+    vs_position: Optional[str],
+    tournament_items: Optional[Tuple],
+    verbose: bool
+) -> Dict:
+    """Memoized recommendation for a canonical spot, shared by all engines"""
+    return get_recommendation_engine()._recommend(
+        hole_cards, community_cards, position, pot_size, to_call,
+        stack_size, vs_position, tournament_items, verbose
+    )
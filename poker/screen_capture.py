@@ -1,17 +1,64 @@
 import numpy as np
 from PIL import Image
 import time
-from typing import Dict, Tuple, Optional, Callable
+from typing import Dict, Tuple, Optional, Callable, Union
 import logging
-import pytesseract
+from tesserocr import PyTessBaseAPI, PSM, OEM
 import re
 import io
 import base64
 import cv2
 import streamlit as st
-from threading import Thread
-from queue import Queue
+from threading import Thread, Condition, local
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import atexit
+
+# OCR page segmentation mode and character whitelist per region: every region
+# holds a single short line, cards and amounts need only a few characters
+CARD_OCR_CONFIG = (PSM.SINGLE_LINE, '23456789TJQKA♣♦♥♠')
+AMOUNT_OCR_CONFIG = (PSM.SINGLE_LINE, '0123456789.,$')
+REGION_OCR_CONFIG = {
+    'hole_cards': CARD_OCR_CONFIG,
+    'community_cards': CARD_OCR_CONFIG,
+    'pot': AMOUNT_OCR_CONFIG,
+    'stack': AMOUNT_OCR_CONFIG
+}
+DEFAULT_OCR_CONFIG = (PSM.SINGLE_BLOCK, '')
+
+# Numeric regions (large glyphs on a uniform background) binarize with a
+# single global Otsu threshold; the rest use a local adaptive threshold
+OTSU_REGIONS = frozenset({'pot', 'stack'})
+
+OCR_WORKERS = len(REGION_OCR_CONFIG)
+CAPTURE_WAIT_TIMEOUT = 0.5  # seconds
+
+# OCR card text: rank followed by suit symbol
+CARD_PATTERN = re.compile(r'([2-9TJQKA])([♣♦♥♠])')
+SUIT_LETTERS = {'♣': 'c', '♦': 'd', '♥': 'h', '♠': 's'}
+
+# ASCII bytes stripped from OCR amounts: everything except digits and '.'
+NON_NUMBER_BYTES = bytes(b for b in range(128) if chr(b) not in '0123456789.')
+
+# Region change detection: mean absolute difference between small grayscale thumbnails
+THUMBNAIL_SIZE = (16, 16)
+CHANGE_THRESHOLD = 1.0
+
+# In-process Tesseract, one API per OCR worker thread (the API is not thread-safe).
+# The pool and its APIs are shared by every capture instance and released at exit;
+# regions are OCR'd in parallel since tesseract releases the GIL
+_TESS_LOCAL = local()
+_TESS_APIS = []
+_OCR_EXECUTOR = ThreadPoolExecutor(max_workers=OCR_WORKERS, thread_name_prefix='ocr')
+
+def _shutdown_ocr():
+    """Stop the OCR workers, then end their Tesseract APIs"""
+    _OCR_EXECUTOR.shutdown(wait=True)
+    for api in _TESS_APIS:
+        api.End()
+    _TESS_APIS.clear()
+
+atexit.register(_shutdown_ocr)
 
 class PokerScreenCapture:
     def __init__(self):
@@ -25,8 +72,13 @@ class PokerScreenCapture:
         self.is_calibrated = False
         self.is_monitoring = False
         self.capture_interval = 2.0  # seconds
-        self.analysis_queue = Queue()
+        # Single-slot mailbox: only the newest capture is analyzed, stale frames are dropped
+        self._latest_capture = None
+        self._capture_ready = Condition()
         self.last_analysis = {}
+        # Per-region thumbnail and OCR result of the last analyzed capture
+        self.last_captures = {}
+        self.last_region_results = {}
         self.setup_logging()
 
     def setup_logging(self):
@@ -37,33 +89,40 @@ class PokerScreenCapture:
         )
         self.logger = logging.getLogger('PokerScreenCapture')
 
+    def decode_base64(self, base64_str: str) -> bytes:
+        """Decode base64 image data, skipping any data URL prefix"""
+        # Slice past the header rather than splitting the whole payload
+        start = base64_str.find(',') + 1
+        return base64.b64decode(base64_str[start:] if start else base64_str)
+
     def base64_to_image(self, base64_str: str) -> Optional[Image.Image]:
         """Convert base64 string to PIL Image"""
         try:
-            # Remove data URL prefix if present
-            if ',' in base64_str:
-                base64_str = base64_str.split(',')[1]
-            
-            # Decode base64 string
-            img_data = base64.b64decode(base64_str)
-            return Image.open(io.BytesIO(img_data))
+            image = Image.open(io.BytesIO(self.decode_base64(base64_str)))
+            image.load()  # Decode once here instead of on first pixel access
+            return image
         except Exception as e:
             self.logger.error(f"Failed to convert base64 to image: {str(e)}")
             return None
 
+    def base64_to_gray(self, base64_str: str) -> Optional[np.ndarray]:
+        """Decode base64 string straight to a grayscale OpenCV image"""
+        try:
+            img_data = np.frombuffer(self.decode_base64(base64_str), np.uint8)
+            return cv2.imdecode(img_data, cv2.IMREAD_GRAYSCALE)
+        except Exception as e:
+            self.logger.error(f"Failed to decode base64 image: {str(e)}")
+            return None
+
     def calibrate_regions(self, template_base64: str) -> bool:
         """Calibrate screen regions using a template image"""
         try:
-            # Convert base64 template to PIL Image
-            template_img = self.base64_to_image(template_base64)
-            if template_img is None:
-                return False
-
-            # Convert PIL Image to CV2 format
-            template = cv2.cvtColor(np.array(template_img), cv2.COLOR_RGB2BGR)
+            # Only the template dimensions are needed: read them from the
+            # image header without decoding the pixels
+            template_img = Image.open(io.BytesIO(self.decode_base64(template_base64)))
 
             # Update regions based on template dimensions
-            template_h, template_w = template.shape[:2]
+            template_w, template_h = template_img.size
             
             self.regions = {
                 'hole_cards': {
@@ -100,35 +159,44 @@ class PokerScreenCapture:
             self.logger.error(f"Calibration failed: {str(e)}")
             return False
 
-    def process_image(self, image: Image.Image) -> np.ndarray:
-        """Process captured image for better OCR results"""
-        # Convert PIL Image to OpenCV format
-        img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+    def to_grayscale(self, image: Image.Image) -> np.ndarray:
+        """Convert captured PIL image to a grayscale OpenCV image"""
+        # np.asarray aliases the PIL buffer; grayscale straight from RGB skips the BGR copy
+        return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+
+    def process_image(self, gray: np.ndarray, region_name: Optional[str] = None) -> np.ndarray:
+        """Process grayscale capture for better OCR results"""
+        if region_name in OTSU_REGIONS:
+            return cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+        # Light smoothing; screen-rendered text has no sensor noise to remove
+        blurred = cv2.medianBlur(gray, 3)
         
         # Apply adaptive thresholding for better text recognition
-        thresh = cv2.adaptiveThreshold(
-            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+        return cv2.adaptiveThreshold(
+            blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
             cv2.THRESH_BINARY, 11, 2
         )
-        
-        # Apply noise reduction
-        denoised = cv2.fastNlMeansDenoising(thresh)
-        
-        # Apply dilation to make text more prominent
-        kernel = np.ones((2,2), np.uint8)
-        dilated = cv2.dilate(denoised, kernel, iterations=1)
-        
-        return dilated
 
-    def extract_text(self, image: np.ndarray) -> str:
-        """Extract text from processed image using OCR"""
+    def _get_tess(self) -> PyTessBaseAPI:
+        """Get the persistent Tesseract API instead of spawning a tesseract process per call"""
+        tess = getattr(_TESS_LOCAL, 'api', None)
+        if tess is None:
+            tess = _TESS_LOCAL.api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+            _TESS_APIS.append(tess)
+        return tess
+
+    def extract_text(self, image: np.ndarray, ocr_config: Tuple[int, str] = DEFAULT_OCR_CONFIG) -> str:
+        """Extract text from processed (single-channel) image using OCR"""
         try:
-            # Configure Tesseract parameters for better accuracy
-            custom_config = r'--oem 3 --psm 6'
-            text = pytesseract.image_to_string(image, config=custom_config)
+            page_seg_mode, whitelist = ocr_config
+            image = np.ascontiguousarray(image, dtype=np.uint8)
+            height, width = image.shape[:2]
+            tess = self._get_tess()
+            tess.SetPageSegMode(page_seg_mode)
+            tess.SetVariable('tessedit_char_whitelist', whitelist)
+            tess.SetImageBytes(image.tobytes(), width, height, 1, width)
+            text = tess.GetUTF8Text()
             return text.strip()
         except Exception as e:
             self.logger.error(f"OCR failed: {str(e)}")
@@ -136,34 +204,37 @@ class PokerScreenCapture:
 
     def parse_cards(self, text: str) -> list:
         """Parse card text into standardized format"""
-        suits = {'♣': 'c', '♦': 'd', '♥': 'h', '♠': 's'}
-        ranks = '23456789TJQKA'
-        
-        cards = []
-        pattern = r'([2-9TJQKA])([♣♦♥♠])'
-        matches = re.finditer(pattern, text)
-        
-        for match in matches:
-            rank, suit = match.groups()
-            if rank in ranks and suit in suits:
-                cards.append(f"{rank}{suits[suit]}")
-        
-        return cards
+        return [rank + SUIT_LETTERS[suit] for rank, suit in CARD_PATTERN.findall(text)]
 
     def parse_numbers(self, text: str) -> float:
         """Parse numerical values (pot size, stack size) from text"""
         try:
-            cleaned = re.sub(r'[^\d.]', '', text)
+            cleaned = text.encode('ascii', 'ignore').translate(None, NON_NUMBER_BYTES).decode()
             if cleaned:
                 return float(cleaned)
         except ValueError:
             pass
         return 0.0
 
-    def analyze_region(self, region_name: str, image: Image.Image) -> Dict:
-        """Analyze a specific region and extract relevant information"""
-        processed = self.process_image(image)
-        text = self.extract_text(processed)
+    def region_changed(self, region_name: str, gray: np.ndarray) -> bool:
+        """Check whether a region differs from its last analyzed capture"""
+        thumb = cv2.resize(gray, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA).astype(np.int16)
+        last_thumb = self.last_captures.get(region_name)
+        if last_thumb is not None and np.abs(thumb - last_thumb).mean() <= CHANGE_THRESHOLD:
+            return False
+        self.last_captures[region_name] = thumb
+        return True
+
+    def analyze_region(self, region_name: str, image: Union[Image.Image, np.ndarray]) -> Dict:
+        """Analyze a specific region (PIL image or grayscale array) and extract relevant information"""
+        gray = image if isinstance(image, np.ndarray) else self.to_grayscale(image)
+        
+        # Reuse the previous OCR result while the region is unchanged
+        if not self.region_changed(region_name, gray) and region_name in self.last_region_results:
+            return dict(self.last_region_results[region_name], timestamp=time.time())
+        
+        processed = self.process_image(gray, region_name)
+        text = self.extract_text(processed, REGION_OCR_CONFIG.get(region_name, DEFAULT_OCR_CONFIG))
         
         result = {'type': region_name, 'raw_text': text, 'timestamp': time.time()}
         
@@ -171,15 +242,16 @@ class PokerScreenCapture:
             result['cards'] = self.parse_cards(text)
         elif region_name in ['pot', 'stack']:
             result['value'] = self.parse_numbers(text)
-            
+        
+        self.last_region_results[region_name] = result
         return result
 
     def process_captured_image(self, base64_img: str, region_name: str) -> Dict:
         """Process a captured image from browser"""
         try:
-            image = self.base64_to_image(base64_img)
-            if image:
-                return self.analyze_region(region_name, image)
+            gray = self.base64_to_gray(base64_img)
+            if gray is not None:
+                return self.analyze_region(region_name, gray)
             return {'error': 'Failed to process image'}
         except Exception as e:
             self.logger.error(f"Image processing failed: {str(e)}")
@@ -207,28 +279,43 @@ class PokerScreenCapture:
         """Main loop for continuous capture and analysis"""
         while self.is_monitoring:
             try:
-                # Process any queued captures
-                while not self.analysis_queue.empty():
-                    capture_data = self.analysis_queue.get()
-                    results = {}
-                    
-                    for region_name in self.regions:
-                        result = self.process_captured_image(
-                            capture_data, region_name
-                        )
-                        results[region_name] = result
-                    
-                    # Store last analysis
-                    self.last_analysis = results
-                    
-                    # Call callback if provided
-                    if callback and callable(callback):
-                        callback(results)
-                    
-                    # Log significant changes
-                    self._log_significant_changes(results)
-                    
-                time.sleep(0.1)  # Prevent busy waiting
+                # Wait for the newest capture; the timeout lets the loop notice a stop
+                with self._capture_ready:
+                    if self._latest_capture is None:
+                        self._capture_ready.wait(timeout=CAPTURE_WAIT_TIMEOUT)
+                    capture_data, self._latest_capture = self._latest_capture, None
+                if capture_data is None:
+                    continue
+                results = {}
+                
+                # Decode the frame once and analyze each region as a view into it
+                gray = self.base64_to_gray(capture_data)
+                if gray is None:
+                    continue
+                
+                futures = {}
+                for region_name, region in self.regions.items():
+                    roi = gray[region['top']:region['top'] + region['height'],
+                               region['left']:region['left'] + region['width']]
+                    if roi.size == 0:
+                        results[region_name] = {'error': 'Region outside captured frame'}
+                        continue
+                    futures[region_name] = _OCR_EXECUTOR.submit(
+                        self.analyze_region, region_name, roi
+                    )
+                
+                for region_name, future in futures.items():
+                    results[region_name] = future.result()
+                
+                # Store last analysis
+                self.last_analysis = results
+                
+                # Call callback if provided
+                if callback and callable(callback):
+                    callback(results)
+                
+                # Log significant changes
+                self._log_significant_changes(results)
                 
             except Exception as e:
                 self.logger.error(f"Error in continuous capture loop: {str(e)}")
@@ -272,5 +359,7 @@ class PokerScreenCapture:
         return self.last_analysis
 
     def add_capture_to_queue(self, base64_img: str):
-        """Add a new capture to the analysis queue"""
-        self.analysis_queue.put(base64_img)
+        """Set the capture to analyze next, replacing any not yet analyzed"""
+        with self._capture_ready:
+            self._latest_capture = base64_img
+            self._capture_ready.notify()
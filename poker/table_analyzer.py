@@ -1,13 +1,75 @@
 import numpy as np
 import cv2
 from typing import Dict, List, Optional, Tuple
-import pytesseract
+from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
 import re
 import logging
 from dataclasses import dataclass
 from PIL import Image
 import time
-from collections import deque
+from collections import deque, OrderedDict
+import hashlib
+import os
+from threading import Lock, local
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+
+# Regions are OCR'd concurrently (main.py limits each tesseract call to one OpenMP thread)
+OCR_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# Structuring element for closing gaps in thresholded glyphs
+MORPH_KERNEL = np.ones((2, 2), np.uint8)
+
+# Amounts are read as a single line of digits
+NUMBER_WHITELIST = '0123456789.'
+
+# Numeric analysis history kept as a struct-of-arrays ring buffer (one row per field)
+HISTORY_SIZE = 10
+HISTORY_FIELDS = ('timestamp', 'pot_size', 'stack_size',
+                  'position_confidence', 'pot_confidence', 'stack_confidence', 'position_id')
+HISTORY_TIMESTAMP = 0
+HISTORY_AMOUNTS = [1, 2]  # pot_size, stack_size
+HISTORY_CONFIDENCES = slice(3, 6)
+HISTORY_POSITION = 6
+UNKNOWN_POSITION_ID = -1
+
+# Thresholded number/position ROIs taller than this are downscaled before OCR
+OCR_TARGET_HEIGHT = 32
+
+# Card ROIs are OCR'd together as one strip of equal-height cards separated by white gaps
+CARD_STRIP_HEIGHT = 48
+CARD_STRIP_GAP = 10
+
+# Precompiled OCR text patterns
+RANK_PATTERN = re.compile('[23456789TJQKA]')
+SUIT_PATTERN = re.compile('[CDHS]')
+SUIT_LETTERS = {'C': 'c', 'D': 'd', 'H': 'h', 'S': 's'}
+AMOUNT_PATTERN = re.compile(r'\d+\.?\d*')
+NON_NUMBER_PATTERN = re.compile(r'[^\d.]')
+
+# Frame gate: when no static region's thumbnail moved by more than this mean absolute
+# difference, only the action area is re-read and the rest of the last analysis reused
+REGION_THUMBNAIL_SIZE = (16, 16)
+FRAME_CHANGE_THRESHOLD = 1.0
+DYNAMIC_REGIONS = frozenset({'action_area'})
+
+# OCR results cached by ROI pixel hash; most regions are unchanged between frames
+OCR_CACHE_SIZE = 256
+
+# In-process Tesseract, one API per OCR worker thread (the API is not thread-safe).
+# The pool and its APIs are shared by every analyzer and released at exit
+_TESS_LOCAL = local()
+_TESS_APIS = []
+_OCR_EXECUTOR = ThreadPoolExecutor(max_workers=OCR_WORKERS, thread_name_prefix='table-ocr')
+
+def _shutdown_ocr():
+    """Stop the OCR workers, then end their Tesseract APIs"""
+    _OCR_EXECUTOR.shutdown(wait=True)
+    for api in _TESS_APIS:
+        api.End()
+    _TESS_APIS.clear()
+
+atexit.register(_shutdown_ocr)
 
 @dataclass
 class TableRegion:
@@ -31,9 +93,27 @@ class TableAnalyzer:
             'MP': {'text': ['MP', 'MIDDLE'], 'confidence': 0.0},
             'CO': {'text': ['CO', 'CUTOFF'], 'confidence': 0.0}
         }
+        # All position label patterns in one regex: a zero-width lookahead at every offset
+        # finds each occurrence in a single pass over the OCR text
+        self._position_keys = tuple(self.position_map)
+        self._position_ids = {position: index for index, position in enumerate(self._position_keys)}
+        self._pattern_positions = {
+            pattern: index
+            for index, patterns in enumerate(self.position_map.values())
+            for pattern in patterns['text']
+        }
+        self._position_pattern = re.compile('(?=({}))'.format('|'.join(
+            re.escape(pattern) for pattern in sorted(self._pattern_positions, key=len, reverse=True)
+        )))
         self.last_analysis = None
-        self.analysis_history = deque(maxlen=10)
+        self.analysis_history = deque(maxlen=HISTORY_SIZE)
+        self.history_values = np.zeros((len(HISTORY_FIELDS), HISTORY_SIZE))
+        self._history_head = 0
+        self._history_count = 0
+        self._last_fingerprint = None
         self.frame_buffer = deque(maxlen=5)  # Store last 5 frames for comparison
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_lock = Lock()
 
     def setup_regions(self):
         """Setup default table regions for analysis with improved structure"""
@@ -56,21 +136,77 @@ class TableAnalyzer:
         # Convert to grayscale
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         
-        # Apply adaptive thresholding
+        # Apply adaptive thresholding against the local box mean (O(1) per pixel)
         thresh = cv2.adaptiveThreshold(
-            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+            gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, 
             cv2.THRESH_BINARY, 11, 2
         )
         
-        # Denoise
-        denoised = cv2.fastNlMeansDenoising(thresh)
+        # Denoise with a cheap median filter; screen text has no sensor noise
+        denoised = cv2.medianBlur(thresh, 3)
         
         # Apply morphological operations
-        kernel = np.ones((2,2), np.uint8)
-        processed = cv2.morphologyEx(denoised, cv2.MORPH_CLOSE, kernel)
+        processed = cv2.morphologyEx(denoised, cv2.MORPH_CLOSE, MORPH_KERNEL)
         
         return processed
 
+    def _downscale_for_ocr(self, image: np.ndarray) -> np.ndarray:
+        """Shrink a uint8 ROI to OCR_TARGET_HEIGHT rows; smaller ROIs are left as is"""
+        height, width = image.shape[:2]
+        if height <= OCR_TARGET_HEIGHT:
+            return image
+        scaled_width = max(1, round(width * OCR_TARGET_HEIGHT / height))
+        return cv2.resize(image, (scaled_width, OCR_TARGET_HEIGHT), interpolation=cv2.INTER_AREA)
+
+    def _get_tess(self) -> PyTessBaseAPI:
+        """Get the persistent Tesseract API instead of spawning a tesseract process per call"""
+        tess = getattr(_TESS_LOCAL, 'api', None)
+        if tess is None:
+            tess = _TESS_LOCAL.api = PyTessBaseAPI(lang='eng', psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+            _TESS_APIS.append(tess)
+        return tess
+
+    def _ocr(self, image: np.ndarray, psm: int, whitelist: str = '',
+             word_boxes: bool = False) -> Tuple[str, List[Tuple]]:
+        """Recognize an image, returning its text and (word, confidence) pairs,
+        extended to (word, confidence, left, right) when word_boxes is set"""
+        image_bytes = np.ascontiguousarray(image, dtype=np.uint8).tobytes()
+        key = (hashlib.blake2b(image_bytes, digest_size=16).digest(), image.shape, psm, whitelist, word_boxes)
+        with self._ocr_cache_lock:
+            if key in self._ocr_cache:
+                self._ocr_cache.move_to_end(key)
+                return self._ocr_cache[key]
+        
+        height, width = image.shape[:2]
+        channels = image.shape[2] if image.ndim == 3 else 1
+        tess = self._get_tess()
+        tess.SetPageSegMode(psm)
+        tess.SetVariable('tessedit_char_whitelist', whitelist)
+        tess.SetImageBytes(image_bytes, width, height, channels, width * channels)
+        if word_boxes:
+            tess.Recognize()
+            words = []
+            # Blank ROIs yield no iterator, empty words and missing boxes
+            iterator = tess.GetIterator()
+            if iterator is not None:
+                for word in iterate_level(iterator, RIL.WORD):
+                    if word.Empty(RIL.WORD):
+                        continue
+                    box = word.BoundingBox(RIL.WORD)
+                    if box is None:
+                        continue
+                    left, _, right, _ = box
+                    words.append((word.GetUTF8Text(RIL.WORD) or '', word.Confidence(RIL.WORD), left, right))
+            result = (tess.GetUTF8Text(), words)
+        else:
+            result = (tess.GetUTF8Text(), tess.MapWordConfidences())
+        
+        with self._ocr_cache_lock:
+            self._ocr_cache[key] = result
+            if len(self._ocr_cache) > OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+        return result
+
     def detect_position(self, image: np.ndarray) -> Tuple[str, float]:
         """Enhanced position detection with confidence scoring"""
         region = self.regions['position_indicator']
@@ -78,24 +214,22 @@ class TableAnalyzer:
                    region.left:region.left + region.width]
         
         processed = self.preprocess_image(roi)
-        text = pytesseract.image_to_string(processed).upper()
+        text = self._ocr(self._downscale_for_ocr(processed), PSM.AUTO)[0].upper()
         
         # Calculate confidence scores for each position
-        position_scores = {}
-        for position, patterns in self.position_map.items():
-            max_score = 0
-            for pattern in patterns['text']:
-                if pattern in text:
-                    # Calculate confidence based on text match quality
-                    similarity = len(pattern) / len(text.strip())
-                    score = similarity * (1.0 if pattern == text.strip() else 0.8)
-                    max_score = max(max_score, score)
-            position_scores[position] = max_score
+        stripped = text.strip()
+        position_scores = np.zeros(len(self._position_keys))
+        for pattern in {match.group(1) for match in self._position_pattern.finditer(text)}:
+            index = self._pattern_positions[pattern]
+            # Calculate confidence based on text match quality
+            similarity = len(pattern) / len(stripped)
+            score = similarity * (1.0 if pattern == stripped else 0.8)
+            position_scores[index] = max(position_scores[index], score)
         
         # Get position with highest confidence
-        if position_scores:
-            best_position = max(position_scores.items(), key=lambda x: x[1])
-            return best_position[0], best_position[1]
+        best = int(position_scores.argmax())
+        if position_scores[best] > 0:
+            return self._position_keys[best], float(position_scores[best])
         
         return 'Unknown', 0.0
 
@@ -104,87 +238,89 @@ class TableAnalyzer:
         roi = image[region.top:region.top + region.height,
                    region.left:region.left + region.width]
         
-        # Convert to HSV for better color detection
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
-        
         cards = []
         confidences = []
-        ranks = '23456789TJQKA'
-        suits = 'cdhs'
         
         # Process image for better card detection
         processed = self.preprocess_image(roi)
         
-        # Detect card contours
-        contours, _ = cv2.findContours(
-            processed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-        )
+        # Detect card blobs: bounding boxes and areas of all components in one call
+        _, _, stats, _ = cv2.connectedComponentsWithStats(processed, connectivity=8, ltype=cv2.CV_32S)
+        blobs = stats[1:][stats[1:, cv2.CC_STAT_AREA] > 100]
+        blobs = blobs[np.argsort(blobs[:, cv2.CC_STAT_LEFT], kind='stable')]  # Left to right
         
-        for contour in contours:
-            if cv2.contourArea(contour) > 100:
-                x, y, w, h = cv2.boundingRect(contour)
-                card_roi = roi[y:y+h, x:x+w]
-                
-                # Enhanced OCR configuration
-                text = pytesseract.image_to_string(
-                    card_roi,
-                    config='--psm 10 --oem 3'
-                )
-                
-                rank_match = re.search(f'[{ranks}]', text.upper())
-                suit_match = re.search(f'[CDHS]', text.upper())
+        if len(blobs) == 0:
+            return cards, 0.0
+        
+        # OCR all cards in one pass and assign each word to the card under its center
+        strip, card_starts = self._build_card_strip(
+            [roi[y:y+h, x:x+w] for x, y, w, h, _ in blobs]
+        )
+        _, words = self._ocr(strip, PSM.SINGLE_LINE, word_boxes=True)
+        
+        card_texts = [[] for _ in card_starts]
+        card_confs = [[] for _ in card_starts]
+        for text, conf, left, right in words:
+            index = np.searchsorted(card_starts, (left + right) // 2, side='right') - 1
+            if index >= 0:
+                card_texts[index].append(text)
+                card_confs[index].append(float(conf))
+        
+        for texts, conf_values in zip(card_texts, card_confs):
+            text = ''.join(texts).upper()
+            rank_match = RANK_PATTERN.search(text)
+            suit_match = SUIT_PATTERN.search(text)
+            
+            if rank_match and suit_match:
+                rank = rank_match.group()
+                suit = SUIT_LETTERS[suit_match.group()]
+                cards.append(f"{rank}{suit}")
                 
-                if rank_match and suit_match:
-                    rank = rank_match.group()
-                    suit = suits[['C','D','H','S'].index(suit_match.group())]
-                    cards.append(f"{rank}{suit}")
-                    
-                    # Calculate confidence based on clarity of detection
-                    confidence = pytesseract.image_to_data(
-                        card_roi,
-                        config='--psm 10 --oem 3',
-                        output_type=pytesseract.Output.DICT
-                    )
-                    conf_values = [float(c) for c in confidence['conf'] if c != '-1']
-                    if conf_values:
-                        confidences.append(sum(conf_values) / len(conf_values) / 100)
+                # Calculate confidence based on clarity of detection
+                if conf_values:
+                    confidences.append(sum(conf_values) / len(conf_values) / 100)
         
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
         return cards, avg_confidence
 
+    def _build_card_strip(self, card_rois: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Join card ROIs side by side at a common height; returns the strip and each card's x offset"""
+        parts = []
+        card_starts = []
+        offset = 0
+        gap = np.full((CARD_STRIP_HEIGHT, CARD_STRIP_GAP) + card_rois[0].shape[2:], 255, np.uint8)
+        for card_roi in card_rois:
+            height, width = card_roi.shape[:2]
+            scaled_width = max(1, round(width * CARD_STRIP_HEIGHT / height))
+            parts.extend((cv2.resize(card_roi, (scaled_width, CARD_STRIP_HEIGHT)), gap))
+            card_starts.append(offset)
+            offset += scaled_width + CARD_STRIP_GAP
+        return np.hstack(parts), np.array(card_starts)
+
     def detect_numbers(self, image: np.ndarray, region: TableRegion) -> Tuple[float, float]:
         """Enhanced number detection with confidence scoring"""
         roi = image[region.top:region.top + region.height,
                    region.left:region.left + region.width]
         
-        processed = self.preprocess_image(roi)
-        
-        # Use multiple OCR passes with different configurations
-        configs = [
-            '--psm 6 digits',
-            '--psm 7 digits',
-            '--psm 8 digits'
-        ]
+        # Digits on a uniform background: one global Otsu threshold on the grayscale ROI
+        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+        processed = self._downscale_for_ocr(
+            cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+        )
         
+        # Single OCR pass restricted to digits
         results = []
-        confidences = []
-        
-        for config in configs:
-            data = pytesseract.image_to_data(
-                processed,
-                config=config,
-                output_type=pytesseract.Output.DICT
-            )
-            
-            for i, text in enumerate(data['text']):
-                if text.strip():
-                    conf = float(data['conf'][i])
-                    if conf > 0:
-                        try:
-                            number = float(re.sub(r'[^\d.]', '', text))
-                            results.append((number, conf))
-                        except ValueError:
-                            continue
+        _, words = self._ocr(processed, PSM.SINGLE_LINE, NUMBER_WHITELIST)
+        
+        for text, conf in words:
+            if text.strip():
+                conf = float(conf)
+                if conf > 0:
+                    try:
+                        number = float(NON_NUMBER_PATTERN.sub('', text))
+                        results.append((number, conf))
+                    except ValueError:
+                        continue
         
         if results:
             # Weight results by confidence
@@ -211,19 +347,15 @@ class TableAnalyzer:
         }
         
         # Multiple OCR passes for better accuracy
-        data = pytesseract.image_to_data(
-            processed,
-            config='--psm 6',
-            output_type=pytesseract.Output.DICT
-        )
+        _, words = self._ocr(processed, PSM.SINGLE_BLOCK)
         
-        text = ' '.join(data['text']).upper()
-        confidences = [float(c) for c in data['conf'] if c != '-1']
+        text = ' '.join(word for word, _ in words).upper()
+        confidences = [float(conf) for _, conf in words]
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
         
         for action in actions.keys():
             if action in text:
-                amount_match = re.search(r'\d+\.?\d*', text)
+                amount_match = AMOUNT_PATTERN.search(text)
                 if amount_match:
                     actions[action]['amount'] = float(amount_match.group())
                     actions[action]['confidence'] = avg_confidence / 100
@@ -239,19 +371,42 @@ class TableAnalyzer:
             # Add frame to buffer for comparison
             self.frame_buffer.append(image)
             
-            # Detect all components with confidence scores
-            position, pos_confidence = self.detect_position(image)
-            hole_cards, hole_confidence = self.detect_cards(image, self.regions['player_cards'])
-            community_cards, comm_confidence = self.detect_cards(image, self.regions['community_cards'])
-            pot_size, pot_confidence = self.detect_numbers(image, self.regions['pot'])
-            stack_size, stack_confidence = self.detect_numbers(image, self.regions['player_stack'])
-            actions = self.detect_actions(image)
+            # Skip OCR of static regions when none of them changed since the last analysis
+            fingerprint = self._frame_fingerprint(image)
+            if (self.last_analysis is not None and self._last_fingerprint is not None
+                    and np.abs(fingerprint - self._last_fingerprint).mean(axis=(1, 2)).max() <= FRAME_CHANGE_THRESHOLD):
+                # OCR stays on the worker threads, which own the Tesseract APIs
+                actions = _OCR_EXECUTOR.submit(self.detect_actions, image).result()
+                analysis = dict(self.last_analysis, timestamp=time.time(), actions=actions)
+                self._record_history(analysis)
+                self.last_analysis = analysis
+                return analysis
+            
+            # Detect all components concurrently; the regions are independent
+            submit = _OCR_EXECUTOR.submit
+            position_future = submit(self.detect_position, image)
+            hole_future = submit(self.detect_cards, image, self.regions['player_cards'])
+            community_future = submit(self.detect_cards, image, self.regions['community_cards'])
+            pot_future = submit(self.detect_numbers, image, self.regions['pot'])
+            stack_future = submit(self.detect_numbers, image, self.regions['player_stack'])
+            actions_future = submit(self.detect_actions, image)
+            other_stack_futures = {
+                pos: submit(self.detect_numbers, image, self.regions[f'{pos}_stack'])
+                for pos in ['btn', 'sb', 'bb', 'utg']
+            }
+            
+            # Collect results with confidence scores
+            position, pos_confidence = position_future.result()
+            hole_cards, hole_confidence = hole_future.result()
+            community_cards, comm_confidence = community_future.result()
+            pot_size, pot_confidence = pot_future.result()
+            stack_size, stack_confidence = stack_future.result()
+            actions = actions_future.result()
             
             # Detect other player stacks
             other_stacks = {}
-            for pos in ['btn', 'sb', 'bb', 'utg']:
-                region = self.regions[f'{pos}_stack']
-                amount, conf = self.detect_numbers(image, region)
+            for pos, future in other_stack_futures.items():
+                amount, conf = future.result()
                 other_stacks[pos] = {'amount': amount, 'confidence': conf}
             
             analysis = {
@@ -274,9 +429,11 @@ class TableAnalyzer:
             if len(self.frame_buffer) >= 2:
                 analysis = self._apply_error_correction(analysis)
             
-            # Store analysis history
-            self.analysis_history.append(analysis)
+            # Store analysis history with a compact position code
+            analysis['position_id'] = self._position_ids.get(analysis['position'], UNKNOWN_POSITION_ID)
+            self._record_history(analysis)
             self.last_analysis = analysis
+            self._last_fingerprint = fingerprint
             
             return analysis
             
@@ -284,6 +441,18 @@ class TableAnalyzer:
             self.logger.error(f"Table analysis failed: {str(e)}")
             return None
 
+    def _frame_fingerprint(self, image: np.ndarray) -> np.ndarray:
+        """Stack small grayscale thumbnails of the static regions for frame comparison"""
+        thumbnails = []
+        for name, region in self.regions.items():
+            if name in DYNAMIC_REGIONS:
+                continue
+            roi = image[region.top:region.top + region.height,
+                       region.left:region.left + region.width]
+            gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+            thumbnails.append(cv2.resize(gray, REGION_THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA))
+        return np.stack(thumbnails).astype(np.int16)
+
     def _apply_error_correction(self, current_analysis: Dict) -> Dict:
         """Apply error correction using frame comparison"""
         if not self.analysis_history:
@@ -291,30 +460,18 @@ class TableAnalyzer:
         
         prev_analysis = self.analysis_history[-1]
         
-        # Correct sudden changes with low confidence
-        def correct_value(curr_val, curr_conf, prev_val, threshold=0.5):
-            if curr_conf < threshold:
-                return prev_val
-            return curr_val
-        
-        # Apply corrections
-        current_analysis['position'] = correct_value(
-            current_analysis['position'],
-            current_analysis['position_confidence'],
-            prev_analysis['position']
-        )
-        
-        current_analysis['pot_size'] = correct_value(
-            current_analysis['pot_size'],
-            current_analysis['pot_confidence'],
-            prev_analysis['pot_size']
-        )
+        # Correct sudden changes with low confidence: keep the previous value
+        if current_analysis['position_confidence'] < 0.5:
+            current_analysis['position'] = prev_analysis['position']
         
-        current_analysis['stack_size'] = correct_value(
-            current_analysis['stack_size'],
-            current_analysis['stack_confidence'],
-            prev_analysis['stack_size']
-        )
+        # Pot and stack corrected together against the latest ring buffer slot
+        prev_slot = (self._history_head - 1) % HISTORY_SIZE
+        low_confidence = np.array([current_analysis['pot_confidence'], current_analysis['stack_confidence']]) < 0.5
+        current_analysis['pot_size'], current_analysis['stack_size'] = np.where(
+            low_confidence,
+            self.history_values[HISTORY_AMOUNTS, prev_slot],
+            [current_analysis['pot_size'], current_analysis['stack_size']]
+        ).tolist()
         
         # Correct cards only if confidence is very low
         if current_analysis['hole_cards_confidence'] < 0.3:
@@ -325,35 +482,33 @@ class TableAnalyzer:
         
         return current_analysis
 
+    def _record_history(self, analysis: Dict):
+        """Append an analysis to the history and its numeric ring buffer"""
+        self.analysis_history.append(analysis)
+        self.history_values[:, self._history_head] = [analysis[field] for field in HISTORY_FIELDS]
+        self._history_head = (self._history_head + 1) % HISTORY_SIZE
+        self._history_count = min(self._history_count + 1, HISTORY_SIZE)
+
+    def _history_order(self) -> np.ndarray:
+        """Ring buffer slots of the recorded analyses, oldest first"""
+        return (self._history_head - self._history_count + np.arange(self._history_count)) % HISTORY_SIZE
+
     def get_action_timing(self) -> Dict:
         """Analyze timing between actions with confidence scores"""
-        if len(self.analysis_history) < 2:
+        if self._history_count < 2:
             return {}
-            
-        timings = []
-        confidences = []
         
-        for i in range(1, len(self.analysis_history)):
-            curr = self.analysis_history[i]
-            prev = self.analysis_history[i-1]
-            
-            time_diff = curr['timestamp'] - prev['timestamp']
-            
-            # Calculate confidence based on detection quality
-            conf = min(
-                curr['position_confidence'],
-                curr['pot_confidence'],
-                curr['stack_confidence']
-            )
-            
-            timings.append(time_diff)
-            confidences.append(conf)
-            
+        values = self.history_values[:, self._history_order()]
+        timings = np.diff(values[HISTORY_TIMESTAMP])
+        
+        # Confidence based on detection quality of each later analysis
+        confidences = values[HISTORY_CONFIDENCES, 1:].min(axis=0)
+        
         return {
-            'average_time': sum(timings) / len(timings),
-            'min_time': min(timings),
-            'max_time': max(timings),
-            'confidence': sum(confidences) / len(confidences)
+            'average_time': float(timings.mean()),
+            'min_time': float(timings.min()),
+            'max_time': float(timings.max()),
+            'confidence': float(confidences.mean())
         }
 
     def detect_significant_changes(self) -> Dict:
@@ -396,18 +551,23 @@ class TableAnalyzer:
                 curr['community_cards_confidence']
             )
         
-        # Check pot changes
-        if abs(curr['pot_size'] - prev['pot_size']) > 0.1:
+        # Check pot and stack changes on the two latest ring buffer slots
+        curr_slot = (self._history_head - 1) % HISTORY_SIZE
+        prev_slot = (self._history_head - 2) % HISTORY_SIZE
+        pot_changed, stack_changed = np.abs(
+            self.history_values[HISTORY_AMOUNTS, curr_slot] - self.history_values[HISTORY_AMOUNTS, prev_slot]
+        ) > 0.1
+        
+        if pot_changed:
             changes['pot_changed']['detected'] = True
             changes['pot_changed']['confidence'] = curr['pot_confidence']
         
-        # Check stack changes
-        if abs(curr['stack_size'] - prev['stack_size']) > 0.1:
+        if stack_changed:
             changes['stack_changed']['detected'] = True
             changes['stack_changed']['confidence'] = curr['stack_confidence']
         
-        # Check position changes
-        if curr['position'] != prev['position']:
+        # Check position changes on the integer position codes
+        if self.history_values[HISTORY_POSITION, curr_slot] != self.history_values[HISTORY_POSITION, prev_slot]:
             changes['position_changed']['detected'] = True
             changes['position_changed']['confidence'] = curr['position_confidence']
         
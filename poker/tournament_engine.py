@@ -1,16 +1,42 @@
-from typing import Dict, Optional, Tuple
+from typing import Dict, Final, Optional, Tuple
+from functools import lru_cache
 import math
+import numpy as np
+
+# Tournament stage ids, indexing TournamentEngine's per-stage arrays
+EARLY, MIDDLE, BUBBLE, IN_MONEY, FINAL_TABLE = range(5)
+
+# Tournament advice text
+_ADVICE_STANDARD: Final[str] = (
+    "STANDARD TOURNAMENT STRATEGY: Maintain healthy stack by picking "
+    "good spots. Balance aggression with conservation based on stack size."
+)
+_ADVICE_PUSHFOLD: Final[str] = (
+    "PUSH/FOLD STRATEGY: With a critical stack (under 10BB), "
+    "focus on push/fold decisions. Look for spots to shove with any "
+    "reasonable hand when folded to you."
+)
+_ADVICE_BUBBLE_SHORT: Final[str] = (
+    "BUBBLE STRATEGY (Short Stack): Extremely selective with "
+    "marginal hands. Only play premium hands unless desperate."
+)
+_ADVICE_BUBBLE_BIG: Final[str] = (
+    "BUBBLE STRATEGY (Big Stack): Apply maximum pressure on "
+    "medium stacks. Target players who are trying to sneak into "
+    "the money."
+)
+_ADVICE_FINAL_TABLE: Final[str] = (
+    "FINAL TABLE STRATEGY: Pay close attention to pay jumps and stack "
+    "sizes. Look for spots to ladder up when short and apply pressure "
+    "when deep stacked."
+)
 
 class TournamentEngine:
     def __init__(self):
-        # Tournament stage multipliers for adjusting ranges
-        self.stage_multipliers = {
-            'early': {'range': 0.8, 'aggression': 0.7},
-            'middle': {'range': 1.0, 'aggression': 1.0},
-            'bubble': {'range': 0.6, 'aggression': 1.3},
-            'in_money': {'range': 1.2, 'aggression': 1.1},
-            'final_table': {'range': 1.1, 'aggression': 1.2}
-        }
+        # Tournament stage multipliers for adjusting ranges, indexed by stage id
+        self._stage_names = ('early', 'middle', 'bubble', 'in_money', 'final_table')
+        self._stage_range = np.array([0.8, 1.0, 0.6, 1.2, 1.1])
+        self._stage_aggression = np.array([0.7, 1.0, 1.3, 1.1, 1.2])
         
         # Stack pressure thresholds in big blinds
         self.stack_pressure = {
@@ -19,6 +45,16 @@ class TournamentEngine:
             'medium': 40,    # Standard play
             'deep': 100      # More room for play
         }
+        
+        # Advice text: standard, push/fold, short/big stack bubble, final table
+        self._advice = (
+            _ADVICE_STANDARD, _ADVICE_PUSHFOLD, _ADVICE_BUBBLE_SHORT, _ADVICE_BUBBLE_BIG, _ADVICE_FINAL_TABLE
+        )
+        
+        # Array view of the thresholds above for batch evaluation
+        self._stack_thresholds = np.array([
+            self.stack_pressure['critical'], self.stack_pressure['shallow'], self.stack_pressure['medium']
+        ])
 
     def calculate_m_ratio(self, stack: float, total_blinds: float) -> float:
         """Calculate Harrington's M-ratio (stack size relative to blinds)"""
@@ -27,33 +63,29 @@ class TournamentEngine:
     def calculate_icm_pressure(self, stack: float, avg_stack: float, 
                              players_left: int, in_money_spots: int) -> float:
         """Calculate ICM pressure factor"""
-        if players_left <= in_money_spots:
-            # Already in the money, less pressure
-            return 0.7
-        elif players_left - in_money_spots <= 3:
-            # Bubble pressure
-            if stack < avg_stack:
-                return 0.4  # High pressure on short stacks
-            else:
-                return 1.2  # Can apply pressure with big stack
-        else:
-            # Normal tournament play
-            return 1.0
+        # 0.7 in the money, 0.4/1.2 for short/big stacks on the bubble, 1.0 otherwise
+        in_money = players_left <= in_money_spots
+        bubble = not in_money and players_left - in_money_spots <= 3
+        normal = not in_money and not bubble
+        short = stack < avg_stack
+        return 0.7 * in_money + bubble * (0.4 * short + 1.2 * (not short)) + 1.0 * normal
 
-    def get_tournament_stage(self, players_left: int, total_players: int) -> str:
-        """Determine tournament stage based on remaining players"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def get_tournament_stage(players_left: int, total_players: int) -> int:
+        """Determine tournament stage id based on remaining players"""
         percentage_left = players_left / total_players
         
         if percentage_left > 0.75:
-            return 'early'
+            return EARLY
         elif percentage_left > 0.3:
-            return 'middle'
+            return MIDDLE
         elif percentage_left > 0.15:
-            return 'bubble'
+            return BUBBLE
         elif players_left > 9:
-            return 'in_money'
+            return IN_MONEY
         else:
-            return 'final_table'
+            return FINAL_TABLE
 
     def adjust_ranges_for_tournament(self, base_range: float, stack: float,
                                    total_blinds: float, players_left: int,
@@ -64,9 +96,6 @@ class TournamentEngine:
         stage = self.get_tournament_stage(players_left, total_players)
         icm_pressure = self.calculate_icm_pressure(stack, avg_stack, players_left, in_money_spots)
         
-        # Get stage multipliers
-        stage_mult = self.stage_multipliers[stage]
-        
         # Stack depth adjustments
         if m_ratio < self.stack_pressure['critical']:
             stack_mult = 0.5  # Push/fold mode
@@ -78,47 +107,64 @@ class TournamentEngine:
             stack_mult = 1.0  # Normal play
             
         # Calculate final adjusted range
-        adjusted_range = base_range * stage_mult['range'] * stack_mult * icm_pressure
+        adjusted_range = base_range * self._stage_range[stage] * stack_mult * icm_pressure
         
         # Additional tournament-specific adjustments
         adjustments = {
             'push_fold_threshold': 15 if m_ratio < self.stack_pressure['critical'] else 0,
-            'bubble_factor': 1.5 if stage == 'bubble' else 1.0,
+            'bubble_factor': 1.5 if stage == BUBBLE else 1.0,
             'icm_pressure': icm_pressure,
-            'stage_aggression': stage_mult['aggression']
+            'stage_aggression': self._stage_aggression[stage]
         }
         
         return min(1.0, max(0.0, adjusted_range)), adjustments
 
-    def get_tournament_advice(self, stage: str, m_ratio: float, 
+    def adjust_ranges_batch(self, base_range: np.ndarray, stack: np.ndarray,
+                            total_blinds: np.ndarray, players_left: np.ndarray,
+                            total_players: np.ndarray, avg_stack: np.ndarray,
+                            in_money_spots: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """adjust_ranges_for_tournament over arrays of scenarios (scalars broadcast)"""
+        base_range, stack, total_blinds, players_left, total_players, avg_stack, in_money_spots = np.broadcast_arrays(
+            *(np.asarray(values, dtype=float) for values in
+              (base_range, stack, total_blinds, players_left, total_players, avg_stack, in_money_spots))
+        )
+        m_ratio = np.divide(stack, total_blinds, out=np.full(stack.shape, np.inf), where=total_blinds > 0)
+        
+        # Stage ids
+        percentage_left = players_left / total_players
+        stage = np.select(
+            [percentage_left > 0.75, percentage_left > 0.3, percentage_left > 0.15, players_left > 9],
+            [EARLY, MIDDLE, BUBBLE, IN_MONEY], default=FINAL_TABLE
+        )
+        
+        # ICM pressure
+        in_money = players_left <= in_money_spots
+        bubble = ~in_money & (players_left - in_money_spots <= 3)
+        icm_pressure = np.select([in_money, bubble & (stack < avg_stack), bubble], [0.7, 0.4, 1.2], default=1.0)
+        
+        # Stack depth adjustments
+        critical, shallow, medium = self._stack_thresholds
+        stack_mult = np.select([m_ratio < critical, m_ratio < shallow, m_ratio < medium], [0.5, 0.7, 0.9], default=1.0)
+        
+        adjusted_range = base_range * self._stage_range[stage] * stack_mult * icm_pressure
+        adjustments = {
+            'push_fold_threshold': np.where(m_ratio < critical, 15, 0),
+            'bubble_factor': np.where(stage == BUBBLE, 1.5, 1.0),
+            'icm_pressure': icm_pressure,
+            'stage_aggression': self._stage_aggression[stage]
+        }
+        
+        return np.clip(adjusted_range, 0.0, 1.0), adjustments
+
+    def get_tournament_advice(self, stage: int, m_ratio: float, 
                             icm_pressure: float) -> str:
         """Get specific tournament stage advice"""
         if m_ratio < self.stack_pressure['critical']:
-            return (
-                "PUSH/FOLD STRATEGY: With a critical stack (under 10BB), "
-                "focus on push/fold decisions. Look for spots to shove with any "
-                "reasonable hand when folded to you."
-            )
-        elif stage == 'bubble':
-            if icm_pressure < 0.7:
-                return (
-                    "BUBBLE STRATEGY (Short Stack): Extremely selective with "
-                    "marginal hands. Only play premium hands unless desperate."
-                )
-            else:
-                return (
-                    "BUBBLE STRATEGY (Big Stack): Apply maximum pressure on "
-                    "medium stacks. Target players who are trying to sneak into "
-                    "the money."
-                )
-        elif stage == 'final_table':
-            return (
-                "FINAL TABLE STRATEGY: Pay close attention to pay jumps and stack "
-                "sizes. Look for spots to ladder up when short and apply pressure "
-                "when deep stacked."
-            )
+            advice = 1
+        elif stage == BUBBLE:
+            advice = 2 if icm_pressure < 0.7 else 3
+        elif stage == FINAL_TABLE:
+            advice = 4
         else:
-            return (
-                "STANDARD TOURNAMENT STRATEGY: Maintain healthy stack by picking "
-                "good spots. Balance aggression with conservation based on stack size."
-            )
+            advice = 0
+        return self._advice[advice]
@@ -1,22 +1,38 @@
+from enum import IntEnum
+from typing import Dict, Final
+
 # Card constants
 RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
 SUITS = ['c', 'd', 'h', 's']
 
+# Reverse lookups: card character -> index in RANKS/SUITS
+RANK_TO_INT: Final[Dict[str, int]] = {rank: index for index, rank in enumerate(RANKS)}
+SUIT_TO_INT: Final[Dict[str, int]] = {suit: index for index, suit in enumerate(SUITS)}
+
 # Position constants
 POSITIONS = ['BTN', 'CO', 'MP', 'EP', 'BB', 'SB']
 
+class Position(IntEnum):
+    """Table positions in preflop action order; values index gto_engine's per-position tables"""
+    EP = 0
+    MP = 1
+    CO = 2
+    BTN = 3
+    SB = 4
+    BB = 5
+
 # Preflop charts (simplified)
-PREMIUM_HANDS = [
+PREMIUM_HANDS = frozenset({
     'AA', 'KK', 'QQ', 'AKs', 'AKo',
     'JJ', 'TT', 'AQs', 'AQo'
-]
+})
 
-STRONG_HANDS = [
+STRONG_HANDS = frozenset({
     '99', '88', 'AJs', 'ATs', 'KQs',
     'AJo', 'KQo'
-]
+})
 
-PLAYABLE_HANDS = [
+PLAYABLE_HANDS = frozenset({
     '77', '66', 'A9s', 'KJs', 'QJs',
     'JTs', 'ATo', 'KJo'
-]
+})
@@ -1,12 +1,31 @@
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 import logging
+from logging.handlers import RotatingFileHandler
 import time
 import psutil
 import threading
 from datetime import datetime
 import os
 
+# Performance sampling cadence (seconds)
+SAMPLE_INTERVAL = 10
+SUMMARY_INTERVAL = 300
+ERROR_RETRY_DELAY = 30
+
+# Megabytes per byte, so memory reporting is a single multiply
+_MB = 1 / (1024 * 1024)
+
+# Log file rotation limits
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Source directories watched recursively; top-level files in '.' are watched non-recursively
+WATCH_DIRS = ('poker', 'utils', 'components', '.streamlit')
+
+# Set once the root logger has its handlers, so further monitors don't duplicate them
+_LOGGING_CONFIGURED = False
+
 class PokerMonitor:
     def __init__(self):
         self.logger = logging.getLogger('PokerMonitor')
@@ -14,24 +33,32 @@ class PokerMonitor:
         self.observer = Observer()
         self.running = False
         self.performance_thread = None
+        self._stop_event = threading.Event()
+        self._proc = psutil.Process()
+        self._last_sample_t = 0.0
+        self._last_cpu_busy = 0.0
         
     def setup_logging(self):
         """Setup logging configuration"""
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
+        global _LOGGING_CONFIGURED
+        if _LOGGING_CONFIGURED:
+            return
+        os.makedirs('logs', exist_ok=True)
             
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler('logs/poker_monitor.log'),
+                RotatingFileHandler('logs/poker_monitor.log', maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT),
                 logging.StreamHandler()
             ]
         )
+        _LOGGING_CONFIGURED = True
 
     def start_monitoring(self):
         """Start all monitoring systems"""
         self.running = True
+        self._stop_event.clear()
         
         # Start performance monitoring thread
         self.performance_thread = threading.Thread(target=self._monitor_performance)
@@ -40,7 +67,10 @@ class PokerMonitor:
         
         # Start file system monitoring
         event_handler = PokerEventHandler()
-        self.observer.schedule(event_handler, '.', recursive=True)
+        self.observer.schedule(event_handler, '.', recursive=False)
+        for path in WATCH_DIRS:
+            if os.path.isdir(path):
+                self.observer.schedule(event_handler, path, recursive=True)
         self.observer.start()
         
         self.logger.info("Monitoring systems started")
@@ -48,6 +78,7 @@ class PokerMonitor:
     def stop_monitoring(self):
         """Stop all monitoring systems"""
         self.running = False
+        self._stop_event.set()
         self.observer.stop()
         self.observer.join()
         if self.performance_thread:
@@ -56,15 +87,17 @@ class PokerMonitor:
 
     def _monitor_performance(self):
         """Monitor system performance metrics"""
-        while self.running:
+        # Baseline for the CPU delta, so the first tick already reports real usage
+        self._cpu_percent()
+        next_summary = time.monotonic() + SUMMARY_INTERVAL
+        
+        # Event wait instead of sleep so stop_monitoring wakes the thread immediately
+        while not self._stop_event.wait(SAMPLE_INTERVAL):
             try:
-                # Get process info
-                process = psutil.Process()
-                
                 # Collect metrics
-                cpu_percent = process.cpu_percent(interval=1)
-                memory_info = process.memory_info()
-                memory_percent = process.memory_percent()
+                cpu_percent = self._cpu_percent()
+                memory_info = self._proc.memory_info()
+                memory_percent = self._proc.memory_percent()
                 
                 # Log metrics if they exceed thresholds
                 if cpu_percent > 80:
@@ -73,38 +106,47 @@ class PokerMonitor:
                     self.logger.warning(f"High memory usage detected: {memory_percent}%")
                 
                 # Log general metrics every 5 minutes
-                if int(time.time()) % 300 == 0:
+                if time.monotonic() >= next_summary:
+                    next_summary += SUMMARY_INTERVAL
                     self.logger.info(
                         f"Performance metrics - CPU: {cpu_percent}%, "
-                        f"Memory: {memory_info.rss / 1024 / 1024:.2f}MB ({memory_percent:.1f}%)"
+                        f"Memory: {memory_info.rss * _MB:.2f}MB ({memory_percent:.1f}%)"
                     )
                 
-                time.sleep(10)  # Check every 10 seconds
-                
             except Exception as e:
                 self.logger.error(f"Error in performance monitoring: {str(e)}")
-                time.sleep(30)  # Wait longer on error
+                self._stop_event.wait(ERROR_RETRY_DELAY)  # Wait longer on error
 
-class PokerEventHandler(FileSystemEventHandler):
+    def _cpu_percent(self) -> float:
+        """Process CPU usage since the previous call, as a percentage of one core"""
+        now = time.monotonic()
+        cpu_times = self._proc.cpu_times()
+        busy = cpu_times.user + cpu_times.system
+        elapsed = now - self._last_sample_t
+        percent = (busy - self._last_cpu_busy) / elapsed * 100 if self._last_sample_t and elapsed > 0 else 0.0
+        self._last_sample_t, self._last_cpu_busy = now, busy
+        return round(percent, 1)
+
+class PokerEventHandler(PatternMatchingEventHandler):
     """Handle file system events"""
+    WATCH_PATTERNS = ['*.py', '*.toml']
+    # Churn that is never worth logging, including the monitor's own log file
+    IGNORE_PATTERNS = ['*/logs/*', '*/__pycache__/*', '*/.git/*']
+    
     def __init__(self):
+        super().__init__(patterns=self.WATCH_PATTERNS, ignore_patterns=self.IGNORE_PATTERNS,
+                         ignore_directories=True)
         self.logger = logging.getLogger('PokerEventHandler')
         
     def on_modified(self, event):
-        if event.is_directory:
-            return
-            
         # Log modifications to important files
-        if event.src_path.endswith(('.py', '.toml', '.streamlit')):
-            self.logger.info(f"Modified: {event.src_path}")
+        self.logger.info(f"Modified: {event.src_path}")
             
     def on_created(self, event):
-        if not event.is_directory:
-            self.logger.info(f"Created: {event.src_path}")
+        self.logger.info(f"Created: {event.src_path}")
             
     def on_deleted(self, event):
-        if not event.is_directory:
-            self.logger.info(f"Deleted: {event.src_path}")
+        self.logger.info(f"Deleted: {event.src_path}")
 
 # Global monitor instance
 monitor = PokerMonitor()